@@ -1,126 +1,92 @@
 import streamlit as st
 import os
-from sklearn.feature_extraction.text import TfidfVectorizer
-import pandas as pd
-import numpy as np
-from PyPDF2 import PdfReader  # Untuk membaca file PDF
-from docx import Document    # Untuk membaca file DOCX
-from reportlab.pdfgen import canvas # Untuk membaca file PDF
-
-# Path ke folder 'documents'
-DOCUMENTS_FOLDER = "documents"
-
-# Daftar stop words untuk Bahasa Indonesia
-STOP_WORDS_ID = [
-    "dan", "di", "ke", "dari", "untuk", "yang", "pada", "dengan", "dalam", "atau", "oleh", 
-    "sebagai", "adalah", "ini", "itu", "tidak", "bukan", "saya", "kami", "kita", "anda", 
-    "dia", "mereka", "ada", "jika", "karena", "tetapi", "namun", "bagaimana", "mengapa",
-    "apa", "dimana", "kapan", "siapa", "dapat", "harus", "akan", "sudah", "belum", "bisa"
-]
-
-# Fungsi untuk memuat daftar file dari folder 'documents'
-def load_document_files(folder):
-    files = []
-    if os.path.exists(folder):
-        files = [f for f in os.listdir(folder) if f.endswith((".txt", ".pdf", ".docx"))]
-    return sorted(files)
-
-# Fungsi untuk membaca file teks
-def read_txt_file(filepath):
-    with open(filepath, "r", encoding="utf-8") as file:
-        return file.read()
-
-# Fungsi untuk membaca file DOCX
-def read_docx_file(filepath):
-    doc = Document(filepath)
-    return "\n".join([paragraph.text for paragraph in doc.paragraphs])
-
-# Fungsi untuk membaca file PDF
-def read_pdf_file(filepath):
-    pdf_reader = PdfReader(filepath)
-    return "\n".join([page.extract_text() for page in pdf_reader.pages])
-
-# Fungsi untuk membaca isi file berdasarkan ekstensi
-def read_file(filepath):
-    if filepath.endswith(".txt"):
-        return read_txt_file(filepath)
-    elif filepath.endswith(".docx"):
-        return read_docx_file(filepath)
-    elif filepath.endswith(".pdf"):
-        return read_pdf_file(filepath)
-    else:
-        raise ValueError("Unsupported file format.")
-
-# Fungsi untuk menyimpan teks sebagai file .txt
-def save_text_to_txt(folder, filename, content):
-    os.makedirs(folder, exist_ok=True)  # Buat folder jika belum ada
-    if not filename.endswith(".txt"):
-        filename += ".txt"  # Pastikan file memiliki ekstensi .txt
-    filepath = os.path.join(folder, filename)
-    with open(filepath, "w", encoding="utf-8") as file:
-        file.write(content)
-    return filepath
-
-# Fungsi untuk menyimpan teks sebagai file .docx
-def save_text_to_docx(folder, filename, content):
-    os.makedirs(folder, exist_ok=True)  # Buat folder jika belum ada
-    if not filename.endswith(".docx"):
-        filename += ".docx"  # Pastikan file memiliki ekstensi .docx
-    filepath = os.path.join(folder, filename)
-    doc = Document()
-    doc.add_paragraph(content)
-    doc.save(filepath)
-    return filepath
-
-# Fungsi untuk menyimpan teks sebagai file .pdf
-def save_text_to_pdf(folder, filename, content):
-    os.makedirs(folder, exist_ok=True)  # Buat folder jika belum ada
-    if not filename.endswith(".pdf"):
-        filename += ".pdf"  # Pastikan file memiliki ekstensi .pdf
-    filepath = os.path.join(folder, filename)
-    c = canvas.Canvas(filepath)
-    y = 800  # Posisi awal teks pada halaman PDF
-    for line in content.split("\n"):
-        c.drawString(100, y, line)
-        y -= 15  # Jarak antar baris
-        if y < 50:  # Jika melebihi halaman, tambahkan halaman baru
-            c.showPage()
-            y = 800
-    c.save()
-    return filepath
-
-# Fungsi utama untuk menyimpan dokumen berdasarkan format pilihan
-def save_document(folder, filename, content, format_choice):
-    if format_choice == "txt":
-        return save_text_to_txt(folder, filename, content)
-    elif format_choice == "docx":
-        return save_text_to_docx(folder, filename, content)
-    elif format_choice == "pdf":
-        return save_text_to_pdf(folder, filename, content)
+import html
+import tracemalloc
+from documents import DOCUMENTS_FOLDER, DOCUMENT_FORMATS, read_file, save_document, writable_formats
+from summarizer import DEFAULT_DIVERSITY, DEFAULT_SUMMARY_LENGTH
+from summary_cache import cached_rank_sentence_spans
+from corpus_model import get_corpus_model
+from engines import DEFAULT_ENGINE, SUMMARIZER_ENGINES
+from instrumentation import TRACE_MEMORY_ENV, begin_collection
+from search_index import get_search_index
+from manifest import get_manifest
+from ingest_queue import FAILED, INDEXED, ingest_queue
+from incremental import IncrementalSummarizer
+from multi_document import summarize_documents
+from export_summaries import EXPORT_FORMATS
+from export_queue import DONE as EXPORT_DONE, FAILED as EXPORT_FAILED, export_queue
+
+# Jumlah halaman PDF yang ditampilkan sebagai pratinjau selama ekstraksi
+PREVIEW_PAGES = 3
+
+# Jumlah maksimal hasil pencarian dokumen
+SEARCH_RESULTS = 20
+
+# Jumlah dokumen per halaman daftar
+DOCUMENTS_PER_PAGE = 50
+
+# Fungsi untuk membuat label dokumen dari entri manifest
+def describe_document(entry, name):
+    if entry is None:
+        return name
+    details = [f"{entry['size'] / 1024:.1f} KB"]
+    if entry["pages"]:
+        details.append(f"{entry['pages']} pages")
+    if entry["chars"] is not None:
+        details.append(f"{entry['chars']:,} chars")
+    return f"{name} ({', '.join(details)})"
+
+# Fungsi untuk menandai span kalimat terpilih di dalam teks (HTML)
+def highlight_spans(text, spans):
+    parts = []
+    position = 0
+    for start, end in sorted(spans):
+        parts.append(html.escape(text[position:start]))
+        parts.append(f"<mark>{html.escape(text[start:end])}</mark>")
+        position = end
+    parts.append(html.escape(text[position:]))
+    return "<div style='white-space: pre-wrap'>" + "".join(parts) + "</div>"
+
+# Label status ingest untuk sidebar
+INGEST_STATUS_ICONS = {"queued": "⏳", "extracting": "⚙️", "indexed": "✅", "failed": "❌"}
+
+# Panel status unggahan; diperbarui sendiri setiap 2 detik tanpa menjalankan ulang seluruh halaman
+@st.fragment(run_every=2)
+def show_ingest_status():
+    jobs = ingest_queue.status(st.session_state["submitted_uploads"].values())
+    for job in jobs:
+        label = f"{INGEST_STATUS_ICONS[job['status']]} {job['name']}: {job['status']}"
+        if job["status"] == FAILED:
+            st.error(f"{label} ({job['error']})")
+        else:
+            st.caption(label)
+
+    # Setelah semua unggahan selesai, jalankan ulang halaman agar daftar dokumen ikut diperbarui
+    finished = [job for job in jobs if job["status"] in (INDEXED, FAILED)]
+    if finished and len(finished) == len(jobs):
+        announced = st.session_state.setdefault("announced_uploads", set())
+        new_jobs = {job["id"] for job in finished} - announced
+        if new_jobs:
+            announced.update(new_jobs)
+            st.rerun()
+
+# Panel status ekspor; kemajuan dibaca dari antrean ekspor setiap 2 detik selama ekspor berjalan di latar belakang
+@st.fragment(run_every=2)
+def show_export_status():
+    job = export_queue.get(st.session_state.get("export_job"))
+    if job is None:
+        return
+    if job["status"] == EXPORT_FAILED:
+        st.error(f"Export failed: {job['error']}")
+    elif job["status"] == EXPORT_DONE:
+        st.success(f"{job['exported']} document summaries exported to {job['path']}.")
+        if os.path.exists(job["path"]):
+            with open(job["path"], "rb") as export_file:
+                st.download_button("Download Export", export_file, file_name=os.path.basename(job["path"]))
+    elif job["total"]:
+        st.progress(job["done"] / job["total"], text=f"Summarized {job['done']} of {job['total']}: {job['name']}")
     else:
-        raise ValueError("Unsupported format. Choose from 'txt', 'docx', or 'pdf'.")
-
-
-# Fungsi untuk menghitung TF-IDF Matrix dan skor per kalimat
-def compute_tf_idf_summary(document):
-    vectorizer = TfidfVectorizer(
-        stop_words=STOP_WORDS_ID,  # Gunakan stop words Bahasa Indonesia
-        token_pattern=r"(?u)\b\w\w+\b"  # Tokenize untuk kata dengan minimal 2 huruf
-    )
-    sentences = document.split('. ')  # Pisahkan dokumen menjadi kalimat
-    tf_idf_matrix = vectorizer.fit_transform(sentences)
-
-    # Hitung skor untuk setiap kalimat
-    sentence_scores = tf_idf_matrix.sum(axis=1).flatten().tolist()[0]
-    ranked_sentences = [(score, sentence) for sentence, score in zip(sentences, sentence_scores)]
-
-    # Urutkan kalimat berdasarkan skor TF-IDF
-    ranked_sentences = sorted(ranked_sentences, key=lambda x: x[0], reverse=True)
-
-    # Pilih beberapa kalimat teratas sebagai ringkasan
-    summary_sentences = [sentence for _, sentence in ranked_sentences[:3]]  # Ambil 3 kalimat teratas
-    summary = '. '.join(summary_sentences)
-    return summary
+        st.progress(0.0, text="Starting export...")
 
 # Streamlit App
 st.set_page_config(
@@ -130,6 +96,9 @@ st.set_page_config(
     
 )
 
+# Kumpulkan catatan performa per tahap untuk rerun ini
+perf_records = begin_collection()
+
 # Header dan Sidebar
 st.markdown(
     """
@@ -217,39 +186,24 @@ input_option = st.sidebar.radio("Choose Input Method", ["Upload File", "Manual T
 
 ## Jika User Mengunggah File
 if input_option == "Upload File":
-    uploaded_file = st.sidebar.file_uploader("Upload File (.txt, .pdf, .docx)", type=["txt", "pdf", "docx"])
-    if uploaded_file is not None:
-        file_extension = uploaded_file.name.split('.')[-1].lower()
-        content = None
-
-        # Proses file berdasarkan tipe
-        if file_extension == "txt":
-            # Jika file teks, baca sebagai string
-            content = uploaded_file.getvalue().decode("utf-8")
-        elif file_extension == "docx":
-            # Jika file DOCX, baca konten menggunakan python-docx
-            doc = Document(uploaded_file)
-            content = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        elif file_extension == "pdf":
-            # Jika file PDF, baca konten menggunakan PyPDF2
-            pdf_reader = PdfReader(uploaded_file)
-            content = "\n".join([page.extract_text() for page in pdf_reader.pages])
-
-        if content:
-            # Simpan file sesuai jenis aslinya
-            if file_extension == "txt":
-                save_text_to_txt(DOCUMENTS_FOLDER, uploaded_file.name, content)
-                st.sidebar.success(f"File '{uploaded_file.name}' has been uploaded and saved as text!")
-            elif file_extension == "docx":
-                save_text_to_docx(DOCUMENTS_FOLDER, uploaded_file.name, content)
-                st.sidebar.success(f"File '{uploaded_file.name}' has been uploaded and saved as a Word document!")
-            elif file_extension == "pdf":
-                save_text_to_pdf(DOCUMENTS_FOLDER, uploaded_file.name, content)
-                st.sidebar.success(f"File '{uploaded_file.name}' has been uploaded and saved as a PDF!")
-            else:
-                st.sidebar.error("Unrecognized file format and cannot be saved.")
-        else:
-            st.sidebar.error("Failed to read file content. Ensure the file is not empty or in the correct format.")
+    upload_types = list(DOCUMENT_FORMATS)
+    uploaded_files = st.sidebar.file_uploader(
+        f"Upload File ({', '.join('.' + extension for extension in upload_types)})",
+        type=upload_types,
+        accept_multiple_files=True,
+    )
+    submitted_uploads = st.session_state.setdefault("submitted_uploads", {})
+    for uploaded_file in uploaded_files or []:
+        # Rerun dengan unggahan yang sama tidak memproses ulang apa pun
+        if uploaded_file.file_id not in submitted_uploads:
+            # Simpan, ekstrak, dan indeks di latar belakang agar halaman tidak membeku
+            submitted_uploads[uploaded_file.file_id] = ingest_queue.submit(
+                DOCUMENTS_FOLDER, uploaded_file.name, uploaded_file.getvalue()
+            )
+
+    if submitted_uploads:
+        with st.sidebar:
+            show_ingest_status()
 
 
 
@@ -260,20 +214,15 @@ elif input_option == "Manual Text Input":
     new_doc_content = st.sidebar.text_area("Document Content", height=150)
 
     # Pilihan format file
-    format_choice = st.sidebar.selectbox("Choose Save Format", ["txt", "docx", "pdf"])
+    format_choice = st.sidebar.selectbox("Choose Save Format", writable_formats())
 
     if st.sidebar.button("Save Document"):
         if new_doc_name and new_doc_content:
             # Tambahkan ekstensi berdasarkan format yang dipilih
             new_doc_name = f"{new_doc_name}.{format_choice}"
 
-            # Simpan file sesuai format
-            if format_choice == "txt":
-                save_text_to_txt(DOCUMENTS_FOLDER, new_doc_name, new_doc_content)
-            elif format_choice == "docx":
-                save_text_to_docx(DOCUMENTS_FOLDER, new_doc_name, new_doc_content)
-            elif format_choice == "pdf":
-                save_text_to_pdf(DOCUMENTS_FOLDER, new_doc_name, new_doc_content)
+            # Simpan file sesuai format (writer diambil dari registry format)
+            save_document(DOCUMENTS_FOLDER, new_doc_name, new_doc_content, format_choice)
 
             # Tampilkan pesan sukses
             st.sidebar.success(f"File '{new_doc_name}' has been saved as {format_choice.upper()}!")
@@ -281,39 +230,238 @@ elif input_option == "Manual Text Input":
             st.sidebar.warning("File name and content cannot be empty.")
 
 
-# Memuat daftar dokumen setelah input baru
-document_files = load_document_files(DOCUMENTS_FOLDER)
+# Sidebar: Pilih engine peringkas
+engine_names = list(SUMMARIZER_ENGINES)
+selected_engine = st.sidebar.selectbox(
+    "Summarizer Engine", engine_names, index=engine_names.index(DEFAULT_ENGINE)
+)
 
-if not document_files:
-    st.sidebar.warning("No documents found in the 'documents' folder.")
+# Sidebar: Panjang ringkasan (jumlah kalimat atau rasio) dan keberagaman kalimat
+length_mode = st.sidebar.radio("Summary Length", ["Sentences", "Ratio"], horizontal=True)
+if length_mode == "Sentences":
+    summary_length = int(
+        st.sidebar.number_input("Number of Sentences", min_value=1, max_value=100, value=DEFAULT_SUMMARY_LENGTH)
+    )
 else:
+    summary_length = float(
+        st.sidebar.slider("Ratio of Sentences", min_value=0.05, max_value=0.95, value=0.2, step=0.05)
+    )
+summary_diversity = st.sidebar.slider(
+    "Diversity (removes similar sentences)", min_value=0.0, max_value=1.0, value=DEFAULT_DIVERSITY, step=0.1
+)
+
+# Sidebar: Stemming Bahasa Indonesia (membaca, dibaca, bacaan -> baca)
+stemming = st.sidebar.checkbox(
+    "Indonesian Stemming",
+    help="Merge inflected word forms before scoring. Uses document-level IDF instead of the corpus IDF.",
+)
+
+# Sidebar: Mode inkremental; saat teks diedit hanya kalimat yang berubah yang diproses ulang (IDF per dokumen)
+incremental_mode = st.sidebar.checkbox(
+    "Incremental Re-summarization",
+    help="Re-process only the edited sentences. Uses document-level IDF instead of the corpus IDF.",
+)
+
+# Memuat daftar dokumen setelah input baru (dari manifest, bukan listdir setiap rerun)
+manifest = get_manifest(DOCUMENTS_FOLDER)
+_, total_documents = manifest.list_documents(limit=0)
+document_files = []
+
+# Sidebar: Cari dokumen (BM25); hasil pencarian menggantikan daftar pilihan dokumen
+search_query = st.sidebar.text_input("Search Documents")
+if search_query and total_documents:
+    search_index = get_search_index(DOCUMENTS_FOLDER)
+    search_index.sync(manifest.revision)
+    search_results = search_index.search(search_query, limit=SEARCH_RESULTS)
+    if search_results:
+        document_files = [result["name"] for result in search_results]
+        with st.sidebar.expander(f"{len(search_results)} matching document(s)"):
+            for result in search_results:
+                start, end = result["snippet"]
+                snippet = search_index.snippet(result["name"], start, end)
+                st.markdown(f"**{result['name']}** ({result['score']:.2f})")
+                st.caption(("…" if start else "") + snippet.replace("\n", " ") + "…")
+    else:
+        st.sidebar.info("No documents match the search. Showing all documents.")
+
+# Sidebar: Filter nama/format dan paginasi daftar dokumen
+if not document_files and total_documents:
+    name_filter = st.sidebar.text_input("Filter by Name")
+    format_filter = st.sidebar.multiselect("Filter by Format", list(DOCUMENT_FORMATS))
+    _, matched_documents = manifest.list_documents(name_filter, format_filter, limit=0)
+    page_count = max(1, -(-matched_documents // DOCUMENTS_PER_PAGE))
+    page = 1
+    if page_count > 1:
+        page = st.sidebar.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+    page_entries, _ = manifest.list_documents(
+        name_filter, format_filter, offset=(page - 1) * DOCUMENTS_PER_PAGE, limit=DOCUMENTS_PER_PAGE
+    )
+    document_files = [entry["name"] for entry in page_entries]
+    if not document_files:
+        st.sidebar.info("No documents match the filter.")
+
+# Sidebar: Mode multi-dokumen; satu ringkasan gabungan dari beberapa dokumen sekaligus
+multi_document_mode = bool(document_files) and st.sidebar.checkbox(
+    "Multi-document Summary", help="Summarize several documents together into one de-duplicated summary."
+)
+
+# Tanpa dokumen terpilih (folder kosong atau filter tidak cocok) kolom konten dimulai kosong
+document_content = ""
+
+if not total_documents:
+    st.sidebar.warning("No documents found in the 'documents' folder.")
+elif multi_document_mode:
+    # Sidebar: Pilih beberapa dokumen
+    selected_documents = st.sidebar.multiselect(
+        "Select Documents", document_files, format_func=lambda name: describe_document(manifest.get(name), name)
+    )
+elif document_files:
     # Sidebar: Pilih Dokumen yang Ada
-    selected_document = st.sidebar.selectbox("Select Document", document_files)
+    selected_document = st.sidebar.selectbox(
+        "Select Document", document_files, format_func=lambda name: describe_document(manifest.get(name), name)
+    )
 
     # Tampilkan isi dokumen yang dipilih
     st.markdown("<div class='content-box'>", unsafe_allow_html=True)
 
 
     document_path = os.path.join(DOCUMENTS_FOLDER, selected_document)
-    document_content = read_file(document_path)
-
-# Buat dua kolom
-col1, col2 = st.columns(2)
-
-# Kolom pertama: Konten dokumen
-with col1:
-    st.subheader("📄 Document Content")
-    document_content = st.text_area("Document Content", document_content, height=400)
-    # Tambahkan tombol di bawah teks area di kolom pertama
-    if st.button("Generate Summary", key="button_konten"):
-        with st.spinner("Summarizing the document..."):
-            summary = compute_tf_idf_summary(document_content)
-
-# Kolom kedua: Hasil ringkasan
-with col2:
-    st.subheader("📃 Document Summary")
-    # Gunakan text_area untuk menampilkan hasil ringkasan
-    if "summary" in locals():
-        st.text_area("Summary Output", summary, height=400)
-    else:
-        st.text_area("Summary Output", "No summary has been generated yet.", height=400)
\ No newline at end of file
+
+    # Tampilkan halaman-halaman awal PDF selama ekstraksi masih berjalan
+    preview = st.empty()
+    preview_pages = []
+
+    def show_pdf_preview(index, page_count, text):
+        if index < PREVIEW_PAGES:
+            preview_pages.append(text)
+        preview.text(
+            f"Extracting page {index + 1} of {page_count}...\n\n" + "\n".join(preview_pages)
+        )
+
+    document_content = read_file(document_path, on_page=show_pdf_preview)
+    preview.empty()
+
+if multi_document_mode:
+    col1, col2 = st.columns(2)
+
+    # Kolom pertama: Dokumen terpilih
+    with col1:
+        st.subheader("📚 Selected Documents")
+        for name in selected_documents:
+            st.caption(describe_document(manifest.get(name), name))
+        if st.button("Generate Combined Summary", key="button_multi", disabled=not selected_documents):
+            with st.spinner(f"Summarizing {len(selected_documents)} documents..."):
+                sentences = summarize_documents(
+                    [(name, read_file(os.path.join(DOCUMENTS_FOLDER, name))) for name in selected_documents],
+                    get_corpus_model(DOCUMENTS_FOLDER),
+                    length=summary_length,
+                    engine=selected_engine,
+                    diversity=summary_diversity,
+                    stemming=stemming,
+                )
+                st.session_state["multi_summary_result"] = {
+                    "documents": list(selected_documents),
+                    "sentences": sentences,
+                }
+
+    # Kolom kedua: Ringkasan gabungan dengan asal setiap kalimat
+    with col2:
+        st.subheader("📃 Combined Summary")
+        multi_result = st.session_state.get("multi_summary_result")
+        if multi_result and multi_result["documents"] == list(selected_documents):
+            st.text_area("Summary Output", " ".join(item["text"] for item in multi_result["sentences"]), height=400)
+            with st.expander("Sentence sources"):
+                st.dataframe([
+                    {
+                        "document": item["document"],
+                        "offset": f"{item['start']}-{item['end']}",
+                        "sentence": item["text"],
+                        "also in": ", ".join(item["also_in"]),
+                    }
+                    for item in multi_result["sentences"]
+                ])
+        else:
+            st.text_area("Summary Output", "No summary has been generated yet.", height=400)
+else:
+    # Buat dua kolom
+    col1, col2 = st.columns(2)
+
+    # Kolom pertama: Konten dokumen
+    with col1:
+        st.subheader("📄 Document Content")
+        document_content = st.text_area("Document Content", document_content, height=400)
+        # Tambahkan tombol di bawah teks area di kolom pertama
+        if st.button("Generate Summary", key="button_konten"):
+            with st.spinner("Summarizing the document..."):
+                if incremental_mode:
+                    # Status inkremental disimpan per sesi, sehingga edit berikutnya memakai hasil sebelumnya
+                    incremental = st.session_state.get("incremental_summarizer")
+                    if incremental is None or incremental.stemming != stemming:
+                        incremental = st.session_state["incremental_summarizer"] = IncrementalSummarizer(stemming)
+                    summary_text, summary_spans = incremental.rank_sentence_spans(
+                        document_content,
+                        length=summary_length,
+                        engine=selected_engine,
+                        diversity=summary_diversity,
+                    )
+                else:
+                    summary_text, summary_spans = cached_rank_sentence_spans(
+                        document_content,
+                        get_corpus_model(DOCUMENTS_FOLDER),
+                        length=summary_length,
+                        engine=selected_engine,
+                        diversity=summary_diversity,
+                        stemming=stemming,
+                    )
+                # Simpan di session_state agar ringkasan tetap tampil setelah interaksi widget lain
+                st.session_state["summary_result"] = {"text": summary_text, "spans": summary_spans}
+
+    # Kolom kedua: Hasil ringkasan
+    with col2:
+        st.subheader("📃 Document Summary")
+        # Gunakan text_area untuk menampilkan hasil ringkasan
+        summary_result = st.session_state.get("summary_result")
+        # Ringkasan hanya ditampilkan selama teks dokumen masih sama dengan teks yang diringkas
+        if summary_result and summary_result["text"] == document_content:
+            summary_text, summary_spans = summary_result["text"], summary_result["spans"]
+            summary = ' '.join(summary_text[start:end] for start, end in summary_spans)
+            st.text_area("Summary Output", summary, height=400)
+
+            # Tandai kalimat ringkasan langsung di teks dokumen
+            with st.expander("Summary sentences in context"):
+                st.markdown(highlight_spans(summary_text, summary_spans), unsafe_allow_html=True)
+        else:
+            st.text_area("Summary Output", "No summary has been generated yet.", height=400)
+
+# Sidebar: Ekspor ringkasan seluruh dokumen dengan pengaturan ringkasan saat ini
+if total_documents:
+    with st.sidebar.expander("Export All Summaries"):
+        export_format = st.selectbox("Export Format", list(EXPORT_FORMATS))
+        if st.button("Export Summaries", key="button_export"):
+            previous_job = export_queue.get(st.session_state.get("export_job"))
+            if previous_job and previous_job["status"] not in (EXPORT_DONE, EXPORT_FAILED):
+                st.warning("An export is already running.")
+            else:
+                # Hanya ekspor terakhir per sesi yang disimpan
+                if previous_job and previous_job["path"] and os.path.exists(previous_job["path"]):
+                    os.remove(previous_job["path"])
+                st.session_state["export_job"] = export_queue.submit(
+                    DOCUMENTS_FOLDER,
+                    export_format,
+                    corpus_model=get_corpus_model(DOCUMENTS_FOLDER),
+                    length=summary_length,
+                    engine=selected_engine,
+                    diversity=summary_diversity,
+                    stemming=stemming,
+                )
+        show_export_status()
+
+# Sidebar: Panel performa (waktu wall, waktu CPU, dan alokasi memori per tahap)
+if st.sidebar.checkbox("Show Performance", key="show_performance"):
+    with st.sidebar.expander("Performance", expanded=True):
+        if perf_records:
+            st.dataframe(perf_records)
+        else:
+            st.caption("No stages were recorded in this run.")
+        if not tracemalloc.is_tracing():
+            st.caption(f"Start the app with {TRACE_MEMORY_ENV}=1 to record allocated memory per stage.")
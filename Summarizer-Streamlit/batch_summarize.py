@@ -0,0 +1,167 @@
+import argparse
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import documents
+from documents import DOCUMENTS_FOLDER, load_document_files, read_file
+from engines import DEFAULT_ENGINE, SUMMARIZER_ENGINES
+from stream_summarizer import LARGE_TEXT_BYTES, compute_large_text_summary
+from summarizer import DEFAULT_DIVERSITY, DEFAULT_SUMMARY_LENGTH, DEFAULT_VECTORIZER, VECTORIZER_MODES, compute_tf_idf_summary
+
+# Model korpus per proses worker (diisi oleh initializer jika --corpus-idf dipakai)
+_corpus_model = None
+
+
+class DocumentTimeout(Exception):
+    pass
+
+
+def _on_timeout(signum, frame):
+    raise DocumentTimeout()
+
+
+# Initializer untuk setiap proses worker
+def _init_worker(folder, use_corpus_idf):
+    global _corpus_model
+    # Paralelisme sudah per dokumen, jadi ekstraksi PDF di dalam worker tetap serial
+    documents.PDF_EXTRACTION_WORKERS = 1
+    if use_corpus_idf:
+        from corpus_model import get_corpus_model
+        _corpus_model = get_corpus_model(folder)
+
+
+# Fungsi yang dijalankan di proses worker untuk satu dokumen
+def summarize_one(folder, filename, time_budget, engine=DEFAULT_ENGINE, length=DEFAULT_SUMMARY_LENGTH,
+                  diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER, stemming=False):
+    started = time.perf_counter()
+    record = {"document": filename}
+    # Batas waktu per dokumen, agar satu PDF besar/rusak tidak menahan seluruh batch
+    use_alarm = time_budget and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_timeout)
+        signal.setitimer(signal.ITIMER_REAL, time_budget)
+    try:
+        filepath = os.path.join(folder, filename)
+        # File teks yang sangat besar (misalnya log) diringkas streaming dengan memori terbatas;
+        # cara ini hanya mendukung engine TF-IDF dengan IDF lokal
+        streaming = (
+            filename.endswith(".txt") and engine == "tfidf" and _corpus_model is None
+            and os.path.getsize(filepath) >= LARGE_TEXT_BYTES
+        )
+        if streaming:
+            record["summary"] = compute_large_text_summary(filepath, length, diversity, stemming)
+        else:
+            content = read_file(filepath)
+            record["summary"] = compute_tf_idf_summary(
+                content, _corpus_model, engine, length, diversity, vectorizer, stemming
+            )
+        record["status"] = "ok"
+    except DocumentTimeout:
+        record["status"] = "timeout"
+        record["error"] = f"Exceeded time budget of {time_budget} seconds."
+    except Exception as error:
+        record["status"] = "error"
+        record["error"] = f"{type(error).__name__}: {error}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+# Fungsi untuk membaca dokumen yang sudah selesai dari file output sebelumnya
+def load_finished(output_path, retry_failed=False):
+    finished = set()
+    if not os.path.exists(output_path):
+        return finished
+    with open(output_path, "r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Baris terakhir bisa terpotong jika proses sebelumnya dihentikan
+            if retry_failed and record.get("status") != "ok":
+                continue
+            finished.add(record.get("document"))
+    return finished
+
+
+# Fungsi utama: ringkas semua dokumen di folder dan tulis hasil ke JSONL
+def summarize_folder(folder, output_path, workers=None, time_budget=None, retry_failed=False, use_corpus_idf=False,
+                     engine=DEFAULT_ENGINE, length=DEFAULT_SUMMARY_LENGTH, diversity=DEFAULT_DIVERSITY,
+                     vectorizer=DEFAULT_VECTORIZER, stemming=False):
+    finished = load_finished(output_path, retry_failed)
+    pending = [f for f in load_document_files(folder) if f not in finished]
+    if not pending:
+        return 0
+
+    if use_corpus_idf:
+        from corpus_model import get_corpus_model
+        get_corpus_model(folder)  # Perbarui dan simpan model sekali sebelum worker dimulai
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    written = 0
+    with open(output_path, "a", encoding="utf-8") as output, ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(folder, use_corpus_idf),
+    ) as pool:
+        futures = [
+            pool.submit(
+                summarize_one, folder, filename, time_budget, engine, length, diversity, vectorizer, stemming
+            )
+            for filename in pending
+        ]
+        for future in as_completed(futures):
+            record = future.result()
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()  # Tulis segera agar hasil tidak hilang saat proses dihentikan
+            written += 1
+            print(f"[{written}/{len(pending)}] {record['document']}: {record['status']} ({record['seconds']}s)")
+    return written
+
+
+# Fungsi untuk membaca argumen panjang ringkasan: "5" = jumlah kalimat, "0.2" = rasio
+def parse_length(value):
+    return float(value) if "." in value else int(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize every document in a folder and write the results as JSONL.")
+    parser.add_argument("folder", nargs="?", default=DOCUMENTS_FOLDER, help="Folder containing .txt, .pdf and .docx files.")
+    parser.add_argument("-o", "--output", default="summaries.jsonl", help="JSONL file to append results to.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="Time budget per document in seconds.")
+    parser.add_argument("--retry-failed", action="store_true", help="Re-run documents that previously failed or timed out.")
+    parser.add_argument("-e", "--engine", choices=list(SUMMARIZER_ENGINES), default=DEFAULT_ENGINE, help="Summarizer engine.")
+    parser.add_argument("-n", "--length", type=parse_length, default=DEFAULT_SUMMARY_LENGTH,
+                        help="Summary length: a sentence count (e.g. 5) or a ratio (e.g. 0.2).")
+    parser.add_argument("--diversity", type=float, default=DEFAULT_DIVERSITY, help="MMR diversity weight (0-1).")
+    parser.add_argument("--corpus-idf", action="store_true", help="Use the corpus-wide IDF model of the folder.")
+    parser.add_argument("--vectorizer", choices=list(VECTORIZER_MODES), default=DEFAULT_VECTORIZER,
+                        help="Local IDF vectorizer; 'hashing' keeps vocabulary memory constant for very large files.")
+    parser.add_argument("--stem", action="store_true",
+                        help="Stem Indonesian words before vectorizing (uses local IDF instead of --corpus-idf).")
+    args = parser.parse_args()
+
+    written = summarize_folder(
+        args.folder,
+        args.output,
+        workers=args.workers,
+        time_budget=args.timeout,
+        retry_failed=args.retry_failed,
+        use_corpus_idf=args.corpus_idf,
+        engine=args.engine,
+        length=args.length,
+        diversity=args.diversity,
+        vectorizer=args.vectorizer,
+        stemming=args.stem,
+    )
+    print(f"{written} document(s) summarized into {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import os
+import time
+
+from benchmarks.report import write_report
+from benchmarks.synthetic import make_text, parse_size
+from pdf_writer import (
+    LINE_LEADING, PAGE_MARGIN, PAGE_SIZE, get_font_metrics, without_a85, wrap_line, write_text_pdf
+)
+
+DEFAULT_SIZES = ["100KB", "1MB", "10MB"]
+
+OUTPUT_FOLDER = os.path.join("benchmarks", "output")
+
+
+# Penulis PDF lama (satu drawString per baris tanpa pembungkusan), disimpan sebagai pembanding
+def write_drawstring_pdf(filepath, content):
+    from reportlab.pdfgen import canvas
+    c = canvas.Canvas(filepath)
+    y = 800
+    pages = 1
+    for line in content.split("\n"):
+        c.drawString(100, y, line)
+        y -= 15
+        if y < 50:
+            c.showPage()
+            pages += 1
+            y = 800
+    c.save()
+    return pages
+
+
+# Pembungkusan baris yang sama dengan pdf_writer, tetapi setiap baris tetap digambar dengan drawString
+# Memisahkan biaya pembungkusan dari manfaat text object per halaman (ASCII85 dimatikan seperti write_text_pdf)
+def write_wrapped_drawstring_pdf(filepath, content):
+    from reportlab.pdfgen import canvas
+    with without_a85():
+        metrics = get_font_metrics()
+        page_width, page_height = PAGE_SIZE
+        c = canvas.Canvas(filepath, pagesize=PAGE_SIZE)
+        c.setFont(metrics.font_name, metrics.font_size)
+        y = page_height - PAGE_MARGIN - metrics.font_size
+        pages = 1
+        for line in content.split("\n"):
+            for wrapped in wrap_line(line, metrics, page_width - 2 * PAGE_MARGIN):
+                if y < PAGE_MARGIN:
+                    c.showPage()
+                    c.setFont(metrics.font_name, metrics.font_size)
+                    pages += 1
+                    y = page_height - PAGE_MARGIN - metrics.font_size
+                c.drawString(PAGE_MARGIN, y, wrapped)
+                y -= LINE_LEADING
+        c.save()
+        return pages
+
+
+# Penulis yang dibandingkan; setiap penulis mengembalikan jumlah halaman
+WRITERS = {
+    "drawstring": write_drawstring_pdf,
+    "drawstring-wrapped": write_wrapped_drawstring_pdf,
+    "streaming": write_text_pdf,
+    # Teks diberikan per potongan 64 KB, seperti saat menulis dari iter_txt_chunks
+    "streaming-chunks": lambda filepath, content: write_text_pdf(
+        filepath, (content[start:start + 65536] for start in range(0, len(content), 65536))
+    ),
+}
+
+
+# Fungsi untuk menulis satu teks dengan satu penulis dan mencatat throughput
+def measure_writer(name, label, text):
+    filepath = os.path.join(OUTPUT_FOLDER, f"pdf-writer-{name}-{label}.pdf")
+    started = time.perf_counter()
+    pages = WRITERS[name](filepath, text)
+    seconds = time.perf_counter() - started
+    megabytes = len(text.encode("utf-8")) / (1024 * 1024)
+    return {
+        "writer": name,
+        "corpus": label,
+        "seconds": round(seconds, 6),
+        "mb_per_s": round(megabytes / seconds, 3) if seconds else None,
+        "pages": pages,
+        "pdf_bytes": os.path.getsize(filepath),
+    }
+
+
+def run_benchmarks(corpora, writers):
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    results = []
+    print("corpus          writer              seconds      MB/s   pages    PDF size")
+    for label, text in corpora:
+        for name in writers:
+            record = measure_writer(name, label, text)
+            results.append(record)
+            print(f"{label:<15} {name:<18} {record['seconds']:8.3f} {record['mb_per_s']:9.2f} {record['pages']:7d} "
+                  f"{record['pdf_bytes']:11d}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF export throughput for the streaming text writer.")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="Comma-separated synthetic corpus sizes.")
+    parser.add_argument("--writers", default=",".join(WRITERS), help="Comma-separated writers to compare.")
+    parser.add_argument("-o", "--output", default=os.path.join("benchmarks", "results-pdf-writer.json"),
+                        help="JSON results file.")
+    args = parser.parse_args()
+
+    corpora = [(size, make_text(parse_size(size))) for size in args.sizes.split(",") if size]
+    writers = [name for name in args.writers.split(",") if name]
+    write_report(args.output, run_benchmarks(corpora, writers))
+
+
+if __name__ == "__main__":
+    main()
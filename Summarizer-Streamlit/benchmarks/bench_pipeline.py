@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+from benchmarks.report import write_report
+from benchmarks.synthetic import make_text, parse_size
+from documents import read_docx_file, read_pdf_file, read_txt_file, save_document
+from segmenter import sentence_spans
+from summarizer import compute_tf_idf_summary
+
+# Ukuran korpus sintetis bawaan: 1 KB sampai 100 MB
+DEFAULT_SIZES = ["1KB", "10KB", "100KB", "1MB", "10MB", "100MB"]
+DEFAULT_FORMATS = ["txt", "docx", "pdf"]
+
+FIXTURES_FOLDER = os.path.join("benchmarks", "fixtures")
+OUTPUT_FOLDER = os.path.join("benchmarks", "output")
+
+# Pembaca per format tanpa melewati cache teks, agar yang diukur adalah parsing sebenarnya
+READERS = {
+    "txt": read_txt_file,
+    "docx": read_docx_file,
+    "pdf": read_pdf_file,
+}
+
+
+# Fungsi untuk menjalankan satu tahap dan mengukur waktu (dan puncak memori jika diminta)
+def measure(function, *args, trace_memory=True):
+    started = time.perf_counter()
+    result = function(*args)
+    seconds = time.perf_counter() - started
+    peak_bytes = None
+    if trace_memory:
+        # Pengukuran memori dijalankan terpisah karena tracemalloc memperlambat eksekusi
+        tracemalloc.start()
+        function(*args)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result, seconds, peak_bytes
+
+
+# Fungsi untuk menyusun satu baris hasil benchmark
+def make_record(size_label, file_format, stage, seconds, peak_bytes, text_bytes, sentences=None):
+    record = {
+        "size": size_label,
+        "format": file_format,
+        "stage": stage,
+        "seconds": round(seconds, 6),
+        "mb_per_s": round(text_bytes / (1024 * 1024) / seconds, 3) if seconds else None,
+        "peak_memory_bytes": peak_bytes,
+    }
+    if sentences is not None:
+        record["sentences_per_s"] = round(sentences / seconds, 1) if seconds else None
+    return record
+
+
+# Fungsi untuk membuat (atau memakai ulang) file fixture dengan writer save_document
+def ensure_fixture(size_label, file_format, text):
+    name = f"corpus_{size_label.lower()}.{file_format}"
+    path = os.path.join(FIXTURES_FOLDER, name)
+    if not os.path.exists(path):
+        save_document(FIXTURES_FOLDER, name, text, file_format)
+    return path
+
+
+# Fungsi untuk menjalankan seluruh benchmark ingest -> summarize -> export
+def run_benchmarks(sizes, formats, trace_memory=True):
+    results = []
+    for size_label in sizes:
+        text = make_text(parse_size(size_label))
+        text_bytes = len(text.encode("utf-8"))
+        sentence_count = len(sentence_spans(text))
+
+        for file_format in formats:
+            path = ensure_fixture(size_label, file_format, text)
+            extracted, seconds, peak = measure(READERS[file_format], path, trace_memory=trace_memory)
+            results.append(make_record(size_label, file_format, "ingest", seconds, peak, text_bytes))
+            print(f"{size_label:>6} {file_format:>4} ingest     {seconds:9.4f}s")
+
+        _, seconds, peak = measure(compute_tf_idf_summary, text, trace_memory=trace_memory)
+        results.append(make_record(size_label, None, "summarize", seconds, peak, text_bytes, sentence_count))
+        print(f"{size_label:>6}      summarize  {seconds:9.4f}s")
+
+        for file_format in formats:
+            name = f"export_{size_label.lower()}"
+            _, seconds, peak = measure(save_document, OUTPUT_FOLDER, name, text, file_format, trace_memory=trace_memory)
+            results.append(make_record(size_label, file_format, "export", seconds, peak, text_bytes))
+            print(f"{size_label:>6} {file_format:>4} export     {seconds:9.4f}s")
+    return results
+
+
+# Fungsi untuk membandingkan hasil dengan baseline (rasio waktu: >1 berarti lebih lambat)
+def compare_with_baseline(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    previous = {(r["size"], r["format"], r["stage"]): r for r in baseline["results"]}
+    print("\nsize   format stage      baseline(s)  current(s)  ratio")
+    for record in results:
+        old = previous.get((record["size"], record["format"], record["stage"]))
+        if old is None or not old["seconds"]:
+            continue
+        ratio = record["seconds"] / old["seconds"]
+        print(f"{record['size']:>6} {str(record['format'] or '-'):>6} {record['stage']:<10} "
+              f"{old['seconds']:11.4f} {record['seconds']:11.4f} {ratio:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ingest -> summarize -> export pipeline.")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="Comma-separated corpus sizes, e.g. 1KB,1MB.")
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS), help="Comma-separated formats.")
+    parser.add_argument("-o", "--output", default=os.path.join("benchmarks", "results.json"), help="JSON results file.")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory pass.")
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        [size for size in args.sizes.split(",") if size],
+        [file_format for file_format in args.formats.split(",") if file_format],
+        trace_memory=not args.no_memory,
+    )
+    write_report(args.output, results)
+
+    if args.baseline:
+        compare_with_baseline(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.report import write_report
+
+# Modul backend berat yang dicatat apakah ikut ter-import
+HEAVY_MODULES = ["PyPDF2", "docx", "reportlab", "pandas", "sklearn"]
+
+# Skenario cold start; setiap skenario dijalankan di proses Python baru
+# "eager-backends" meniru import di level modul sebelum registry format dibuat lazy
+# PDF dibaca dengan read_pdf_file (tanpa cache teks) agar parsing benar-benar terjadi
+SCENARIOS = {
+    "eager-backends": (
+        "import PyPDF2, docx, pandas, numpy\n"
+        "from reportlab.pdfgen import canvas\n"
+        "import documents\n"
+        "documents.read_file(TXT_PATH)\n"
+    ),
+    "lazy-txt": (
+        "import documents\n"
+        "documents.read_file(TXT_PATH)\n"
+    ),
+    "lazy-pdf": (
+        "import documents\n"
+        "documents.read_pdf_file(PDF_PATH)\n"
+    ),
+    # Import yang dijalankan app.py sebelum halaman pertama tampil (tanpa Streamlit itu sendiri)
+    "app-imports": (
+        "import documents, summarizer, summary_cache, corpus_model, engines, instrumentation\n"
+        "import search_index, manifest, ingest_queue, incremental\n"
+    ),
+}
+
+FIXTURES_FOLDER = os.path.join("benchmarks", "fixtures")
+
+# Kode pembungkus: ukur waktu skenario dan modul berat yang ter-import, lalu cetak sebagai JSON
+RUNNER = """
+import json, sys, time
+TXT_PATH, PDF_PATH = {txt_path!r}, {pdf_path!r}
+started = time.perf_counter()
+exec(compile({code!r}, "scenario", "exec"))
+seconds = time.perf_counter() - started
+print(json.dumps({{"seconds": seconds, "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+# Fungsi untuk membuat fixture kecil .txt dan .pdf
+def ensure_fixtures():
+    from benchmarks.synthetic import make_text
+    from documents import save_document
+
+    text = make_text(4 * 1024)
+    paths = {}
+    for file_format in ("txt", "pdf"):
+        path = os.path.join(FIXTURES_FOLDER, f"startup.{file_format}")
+        if not os.path.exists(path):
+            save_document(FIXTURES_FOLDER, f"startup.{file_format}", text, file_format)
+        paths[file_format] = path
+    return paths
+
+
+# Fungsi untuk menjalankan satu skenario di proses baru
+def run_scenario(name, paths):
+    script = RUNNER.format(txt_path=paths["txt"], pdf_path=paths["pdf"], code=SCENARIOS[name], heavy=HEAVY_MODULES)
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_seconds"] = time.perf_counter() - started
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the document backends.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Fresh processes per scenario.")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run.")
+    parser.add_argument("-o", "--output", default=os.path.join("benchmarks", "results-startup.json"),
+                        help="JSON results file.")
+    args = parser.parse_args()
+
+    paths = ensure_fixtures()
+    results = []
+    print("scenario         median(s)  process(s)  heavy modules loaded")
+    for name in [scenario for scenario in args.scenarios.split(",") if scenario]:
+        runs = [run_scenario(name, paths) for _ in range(args.repeat)]
+        record = {
+            "scenario": name,
+            "median_seconds": round(statistics.median(run["seconds"] for run in runs), 4),
+            "median_process_seconds": round(statistics.median(run["process_seconds"] for run in runs), 4),
+            "loaded": runs[-1]["loaded"],
+        }
+        results.append(record)
+        print(f"{name:<16} {record['median_seconds']:9.4f} {record['median_process_seconds']:11.4f}  "
+              f"{', '.join(record['loaded']) or '-'}")
+
+    write_report(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import time
+
+from benchmarks.report import write_report
+from benchmarks.synthetic import make_text, parse_size
+from documents import read_file
+from stemmer import cached_stem, stem_word, stemming_analyzer
+from summarizer import build_analyzer
+
+DEFAULT_SIZES = ["100KB", "1MB", "10MB"]
+
+# Varian analyzer yang dibandingkan: tanpa stemming, stemming tanpa cache, dan stemming dengan cache LRU
+ANALYZERS = {
+    "none": lambda: build_analyzer(),
+    "stem-uncached": lambda: stemming_analyzer(build_analyzer(), stem_word),
+    "stem-cached": lambda: stemming_analyzer(build_analyzer(), cached_stem),
+}
+
+
+# Fungsi untuk menjalankan satu analyzer atas teks; cache dikosongkan dulu agar hasil mencakup cold start
+def measure_analyzer(name, text):
+    analyzer = ANALYZERS[name]()
+    cached_stem.cache_clear()
+    started = time.perf_counter()
+    tokens = analyzer(text)
+    seconds = time.perf_counter() - started
+    record = {
+        "analyzer": name,
+        "seconds": round(seconds, 6),
+        "tokens": len(tokens),
+        "tokens_per_s": round(len(tokens) / seconds, 1) if seconds else None,
+        "vocabulary": len(set(tokens)),
+    }
+    if name == "stem-cached":
+        info = cached_stem.cache_info()
+        record["cache_hit_rate"] = round(info.hits / ((info.hits + info.misses) or 1), 4)
+    return record
+
+
+def run_benchmarks(corpora):
+    results = []
+    print("corpus          analyzer        tokens/s    vocabulary  hit rate")
+    for label, text in corpora:
+        for name in ANALYZERS:
+            record = measure_analyzer(name, text)
+            record["corpus"] = label
+            results.append(record)
+            hit_rate = record.get("cache_hit_rate")
+            print(f"{label:<15} {name:<15} {record['tokens_per_s']:11.0f} {record['vocabulary']:11d}  "
+                  f"{'-' if hit_rate is None else f'{hit_rate:.2%}'}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vocabulary size and throughput of the Indonesian stemmer.")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="Comma-separated synthetic corpus sizes.")
+    parser.add_argument("--files", nargs="*", default=[], help="Real documents to include (.txt, .pdf, .docx).")
+    parser.add_argument("-o", "--output", default=os.path.join("benchmarks", "results-stemmer.json"),
+                        help="JSON results file.")
+    args = parser.parse_args()
+
+    corpora = [(size, make_text(parse_size(size))) for size in args.sizes.split(",") if size]
+    corpora += [(os.path.basename(path), read_file(path)) for path in args.files]
+    write_report(args.output, run_benchmarks(corpora))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+from benchmarks.synthetic import make_text, parse_size
+
+
+# Fungsi untuk menghitung persentil dari daftar latensi yang sudah diurutkan
+def percentile(values, fraction):
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+# Satu klien: kirim permintaan berulang lewat satu koneksi keep-alive sampai waktu habis
+def run_client(url, bodies, deadline, stats, lock):
+    target = urlparse(url)
+    connection = http.client.HTTPConnection(target.hostname, target.port, timeout=120)
+    latencies = []
+    statuses = {}
+    index = 0
+    while time.perf_counter() < deadline:
+        body = bodies[index % len(bodies)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            connection.request("POST", target.path, body=body, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            status = "error"
+            connection.close()
+            connection = http.client.HTTPConnection(target.hostname, target.port, timeout=120)
+        latencies.append(time.perf_counter() - started)
+        statuses[status] = statuses.get(status, 0) + 1
+    connection.close()
+    with lock:
+        stats["latencies"].extend(latencies)
+        for status, count in statuses.items():
+            stats["statuses"][status] = stats["statuses"].get(status, 0) + count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test a running summarize_service instance.")
+    parser.add_argument("--url", default="http://127.0.0.1:8600/summarize", help="Endpoint to POST to.")
+    parser.add_argument("-c", "--concurrency", type=int, default=32, help="Number of concurrent clients.")
+    parser.add_argument("-d", "--duration", type=float, default=15.0, help="Test duration in seconds.")
+    parser.add_argument("--size", default="4KB", help="Size of each synthetic document, e.g. 4KB.")
+    parser.add_argument("--distinct", type=int, default=50,
+                        help="Number of distinct documents; repeats exercise the summary cache.")
+    parser.add_argument("-o", "--output", help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    bodies = [
+        json.dumps({"text": make_text(parse_size(args.size), seed=seed)}).encode("utf-8")
+        for seed in range(args.distinct)
+    ]
+    stats = {"latencies": [], "statuses": {}}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + args.duration
+    clients = [
+        threading.Thread(target=run_client, args=(args.url, bodies, deadline, stats, lock))
+        for _ in range(args.concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(stats["latencies"])
+    ok = stats["statuses"].get(200, 0)
+    report = {
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "ok_per_s": round(ok / elapsed, 1),
+        "statuses": {str(status): count for status, count in stats["statuses"].items()},
+        "latency_ms": {
+            name: round(percentile(latencies, fraction) * 1000, 2) if latencies else None
+            for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        },
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import json
+import os
+import platform
+import time
+
+
+# Fungsi untuk mencatat lingkungan pengukuran (versi Python, platform, jumlah CPU, waktu)
+def environment():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+# Fungsi untuk menulis laporan benchmark (lingkungan + hasil) sebagai JSON
+def write_report(path, results):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=2)
+    print(f"\nResults written to {path}.")
@@ -0,0 +1,44 @@
+import random
+
+# Kosakata Bahasa Indonesia untuk membuat korpus sintetis
+WORDS_ID = [
+    "pemerintah", "masyarakat", "pendidikan", "ekonomi", "pembangunan", "kebijakan", "daerah",
+    "penelitian", "data", "analisis", "sistem", "informasi", "teknologi", "pengembangan",
+    "kesehatan", "program", "kegiatan", "hasil", "proses", "laporan", "anggaran", "produksi",
+    "pertanian", "industri", "sekolah", "siswa", "guru", "bahasa", "budaya", "sejarah",
+    "membaca", "menulis", "dibaca", "bacaan", "mempelajari", "pembelajaran", "meningkatkan",
+    "peningkatan", "menurunkan", "penurunan", "kualitas", "kuantitas", "wilayah", "provinsi",
+    "kota", "desa", "penduduk", "pekerja", "perusahaan", "pasar", "harga", "nilai", "jumlah",
+    "tahun", "bulan", "minggu", "hari", "besar", "kecil", "baru", "lama", "penting", "utama",
+    "dan", "di", "ke", "dari", "untuk", "yang", "pada", "dengan", "dalam", "atau", "oleh",
+    "sebagai", "adalah", "ini", "itu", "tidak", "akan", "sudah", "dapat", "harus",
+]
+
+ENDINGS = [".", ".", ".", ".", "?", "!"]
+
+
+# Fungsi untuk membuat satu kalimat sintetis
+def make_sentence(rng, min_words=6, max_words=20):
+    words = rng.choices(WORDS_ID, k=rng.randint(min_words, max_words))
+    return " ".join(words).capitalize() + rng.choice(ENDINGS)
+
+
+# Fungsi untuk membuat teks sintetis sebesar kira-kira `size_bytes` (deterministik untuk `seed`)
+def make_text(size_bytes, seed=0, sentences_per_paragraph=6):
+    rng = random.Random(seed)
+    paragraphs = []
+    size = 0
+    while size < size_bytes:
+        paragraph = " ".join(make_sentence(rng) for _ in range(sentences_per_paragraph))
+        paragraphs.append(paragraph)
+        size += len(paragraph.encode("utf-8")) + 1
+    return "\n".join(paragraphs)[:size_bytes]
+
+
+# Fungsi untuk mengubah teks ukuran seperti "10KB" atau "1MB" menjadi byte
+def parse_size(text):
+    text = text.strip().upper()
+    for suffix, factor in (("GB", 1024 ** 3), ("MB", 1024 ** 2), ("KB", 1024), ("B", 1)):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
@@ -0,0 +1,184 @@
+import hashlib
+import os
+import pickle
+import threading
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+from documents import DOCUMENTS_FOLDER, read_file
+from manifest import get_manifest
+from summarizer import STOP_WORDS_ID, TOKEN_PATTERN
+
+# Lokasi file model korpus yang disimpan di disk
+MODEL_PATH = os.path.join(".cache", "corpus_model.pkl")
+
+
+# Fungsi untuk membuat analyzer yang sama dengan TfidfVectorizer di summarizer
+def build_analyzer():
+    return CountVectorizer(stop_words=STOP_WORDS_ID, token_pattern=TOKEN_PATTERN).build_analyzer()
+
+
+# Model IDF tingkat korpus: kosakata, document frequency, dan vektor IDF
+# Setiap file di folder dokumen dihitung sebagai satu dokumen
+class CorpusModel:
+    def __init__(self, folder=DOCUMENTS_FOLDER):
+        self.folder = os.path.abspath(folder)
+        self.vocabulary = {}
+        self.document_frequency = np.zeros(0, dtype=np.int64)
+        # nama file -> {"fingerprint": (size, mtime), "terms": indeks term unik}
+        self.documents = {}
+        self.idf = np.zeros(0, dtype=np.float64)
+        self.revision = ""
+        self.synced_revision = None  # Revisi manifest terakhir yang sudah disinkronkan (lihat sync)
+        self._analyzer = build_analyzer()
+        self._lock = threading.Lock()
+        self._update_lock = threading.Lock()  # Hanya satu pembaruan yang membaca file pada satu waktu
+
+    @property
+    def n_documents(self):
+        return len(self.documents)
+
+    # Tambahkan satu dokumen: hanya term unik di dokumen itu yang diperbarui
+    def add_document(self, name, text, fingerprint=None):
+        if name in self.documents:
+            self.remove_document(name)
+        self._add_terms(name, set(self._analyzer(text)), fingerprint)
+
+    # Catat term unik satu dokumen ke kosakata dan document frequency
+    def _add_terms(self, name, terms, fingerprint):
+        indices = []
+        for term in terms:
+            index = self.vocabulary.get(term)
+            if index is None:
+                index = len(self.vocabulary)
+                self.vocabulary[term] = index
+            indices.append(index)
+        if len(self.vocabulary) > len(self.document_frequency):
+            grown = np.zeros(len(self.vocabulary), dtype=np.int64)
+            grown[:len(self.document_frequency)] = self.document_frequency
+            self.document_frequency = grown
+        indices = np.array(sorted(indices), dtype=np.int64)
+        self.document_frequency[indices] += 1
+        self.documents[name] = {"fingerprint": fingerprint, "terms": indices}
+
+    # Hapus satu dokumen dari statistik korpus
+    def remove_document(self, name):
+        entry = self.documents.pop(name, None)
+        if entry is not None:
+            self.document_frequency[entry["terms"]] -= 1
+
+    # Sinkronkan model dengan manifest folder; folder hanya dibaca ulang jika revisi manifest berubah
+    # Jika pembaruan lain sedang berjalan, model yang ada dipakai apa adanya (tidak menunggu)
+    def sync(self, manifest):
+        revision = manifest.revision
+        if revision == self.synced_revision or not self._update_lock.acquire(blocking=False):
+            return False
+        try:
+            changed = self.update(manifest.fingerprints())
+            self.synced_revision = revision
+            return changed
+        finally:
+            self._update_lock.release()
+
+    # Perbarui model terhadap {nama file: (ukuran, mtime)}: hanya file baru, berubah, atau terhapus yang diproses
+    # File dibaca dan dianalisis tanpa memegang lock, sehingga transform() di sesi lain tidak ikut menunggu;
+    # lock hanya dipegang saat perubahan document frequency diterapkan
+    def update(self, current):
+        with self._lock:
+            removed = [name for name in self.documents if name not in current]
+            pending = [
+                (name, fingerprint) for name, fingerprint in current.items()
+                if name not in self.documents or self.documents[name]["fingerprint"] != fingerprint
+            ]
+
+        parsed = []
+        for name, fingerprint in pending:
+            try:
+                text = read_file(os.path.join(self.folder, name))
+            except Exception:
+                continue  # File rusak tidak boleh menggagalkan pembaruan korpus
+            parsed.append((name, fingerprint, set(self._analyzer(text))))
+
+        with self._lock:
+            for name in removed:
+                self.remove_document(name)
+            for name, fingerprint, terms in parsed:
+                self.remove_document(name)
+                self._add_terms(name, terms, fingerprint)
+            changed = bool(removed or parsed)
+            if changed or len(self.idf) != len(self.vocabulary):
+                self._compute_idf()
+            return changed
+
+    # IDF dengan smoothing yang sama seperti TfidfVectorizer (smooth_idf=True)
+    def _compute_idf(self):
+        n = self.n_documents
+        self.idf = np.log((1 + n) / (1 + self.document_frequency)) + 1
+        # Revisi berubah setiap kali isi korpus berubah (dipakai sebagai bagian kunci cache ringkasan)
+        state = repr(sorted((name, entry["fingerprint"]) for name, entry in self.documents.items()))
+        self.revision = hashlib.sha256(state.encode("utf-8")).hexdigest()[:16]
+
+    # Ubah kalimat menjadi matriks TF-IDF memakai kosakata dan IDF korpus
+    def transform(self, sentences):
+        with self._lock:
+            vocabulary = dict(self.vocabulary)
+            idf = self.idf.copy()
+        if not vocabulary:
+            return sparse.csr_matrix((sum(1 for _ in sentences), 0), dtype=np.float64)
+        counter = CountVectorizer(
+            stop_words=STOP_WORDS_ID,
+            token_pattern=TOKEN_PATTERN,
+            vocabulary=vocabulary,
+        )
+        counts = counter.transform(sentences).astype(np.float64)
+        return normalize(counts.multiply(idf).tocsr(), norm="l2")
+
+    def save(self, path=MODEL_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._lock:
+            state = {
+                "folder": self.folder,
+                "vocabulary": self.vocabulary,
+                "document_frequency": self.document_frequency,
+                "documents": self.documents,
+            }
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, folder=DOCUMENTS_FOLDER, path=MODEL_PATH):
+        model = cls(folder)
+        try:
+            with open(path, "rb") as file:
+                state = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return model
+        if state.get("folder") != model.folder:
+            return model  # Model milik folder lain, bangun ulang untuk folder ini
+        model.vocabulary = state["vocabulary"]
+        model.document_frequency = state["document_frequency"]
+        model.documents = state["documents"]
+        model._compute_idf()
+        return model
+
+
+_models = {}
+_models_lock = threading.Lock()
+
+
+# Fungsi untuk mengambil model korpus yang sudah diperbarui terhadap isi folder
+# Pemindaian folder dilakukan manifest (paling sering sekali per RESCAN_SECONDS), jadi panggilan berulang murah
+def get_corpus_model(folder=DOCUMENTS_FOLDER, path=MODEL_PATH):
+    with _models_lock:
+        model = _models.get(folder)
+        if model is None:
+            model = CorpusModel.load(folder, path)
+            _models[folder] = model
+    if model.sync(get_manifest(folder)):
+        model.save(path)
+    return model
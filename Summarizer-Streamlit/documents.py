@@ -0,0 +1,268 @@
+import codecs
+import importlib
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+# Backend format (PyPDF2, python-docx, reportlab) baru di-import di dalam fungsi saat pertama dipakai,
+# sehingga proses yang hanya memakai .txt tidak menanggung biaya import-nya
+from text_cache import cached_read  # Cache teks hasil ekstraksi PDF/DOCX
+from instrumentation import timed  # Pengukuran waktu dan memori per tahap
+
+# Path ke folder 'documents'
+DOCUMENTS_FOLDER = "documents"
+
+# Ekstraksi PDF paralel: jumlah proses (None = jumlah CPU) dan batas minimal halaman
+# PDF yang lebih kecil diekstrak serial karena biaya memulai proses lebih besar dari hematnya
+PDF_EXTRACTION_WORKERS = None
+PARALLEL_PDF_MIN_PAGES = 48
+
+# Jumlah potongan rentang halaman per proses, agar beban tetap seimbang antar proses
+PDF_RANGES_PER_WORKER = 4
+
+# File .txt didekode per potongan sebesar ini dari memory map; deteksi encoding memakai sampel awal file
+TXT_CHUNK_BYTES = 1024 * 1024
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Encoding cadangan jika sampel bukan UTF-8 yang valid (byte yang tidak dikenal diganti U+FFFD)
+FALLBACK_ENCODING = "cp1252"
+
+# Registry format dokumen: ekstensi (tanpa titik) -> pembaca, penulis, dan pengaturannya
+# Pembaca/penulis boleh berupa fungsi atau string "modul:fungsi" yang baru di-import saat pertama dipakai
+DOCUMENT_FORMATS = {}
+
+# Fungsi untuk mendaftarkan format baru
+# `cached`: hasil pembaca disimpan di cache teks; `progress`: pembaca menerima callback `on_page`
+# `page_counter(filepath)` opsional, dipakai manifest untuk jumlah halaman
+# `limits`: pembaca menerima `start_page`, `end_page`, dan `max_chars` (lihat read_pdf_file)
+def register_format(extension, reader, writer=None, cached=True, progress=False, page_counter=None, limits=False):
+    DOCUMENT_FORMATS[extension.lower().lstrip(".")] = {
+        "reader": reader,
+        "writer": writer,
+        "cached": cached,
+        "progress": progress,
+        "page_counter": page_counter,
+        "limits": limits,
+    }
+
+# Fungsi untuk mengambil fungsi dari registry, meng-import modulnya jika masih berupa string
+def resolve_backend(target):
+    if isinstance(target, str):
+        module_name, _, function_name = target.partition(":")
+        target = getattr(importlib.import_module(module_name), function_name)
+    return target
+
+# Fungsi untuk mengambil pengaturan format berdasarkan ekstensi (dengan atau tanpa titik)
+def get_format(extension):
+    try:
+        return DOCUMENT_FORMATS[extension.lower().lstrip(".")]
+    except KeyError:
+        raise ValueError(f"Unsupported file format '{extension}'. Choose from {', '.join(DOCUMENT_FORMATS)}.")
+
+# Fungsi untuk mengambil daftar ekstensi yang didukung, misalnya (".txt", ".pdf", ".docx")
+def document_extensions():
+    return tuple(f".{extension}" for extension in DOCUMENT_FORMATS)
+
+# Fungsi untuk mengambil daftar format yang bisa ditulis (punya writer)
+def writable_formats():
+    return [extension for extension, document_format in DOCUMENT_FORMATS.items() if document_format["writer"]]
+
+# Fungsi untuk memuat daftar file dari folder 'documents'
+def load_document_files(folder):
+    files = []
+    if os.path.exists(folder):
+        extensions = document_extensions()
+        files = [f for f in os.listdir(folder) if f.endswith(extensions)]
+    return sorted(files)
+
+# Fungsi untuk menebak encoding dari sampel byte awal: BOM, lalu UTF-8, lalu encoding cadangan
+def detect_encoding(sample):
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        # Decoder inkremental: karakter multi-byte yang terpotong di akhir sampel tidak dianggap error
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+
+# Fungsi untuk mencari posisi setelah batas kalimat terakhir (baris baru atau tanda akhir kalimat + spasi)
+def last_sentence_boundary(text):
+    return max(text.rfind("\n"), text.rfind(". "), text.rfind("? "), text.rfind("! ")) + 1
+
+# Fungsi untuk membaca file teks sebagai aliran potongan yang berakhir di batas kalimat
+# File di-memory-map dan didekode bertahap, jadi memori yang dipakai sebatas satu potongan
+# Baris baru \r\n dan \r diubah menjadi \n seperti open() dalam mode teks
+def iter_txt_chunks(filepath, chunk_bytes=TXT_CHUNK_BYTES):
+    with open(filepath, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            encoding = detect_encoding(mapped[:ENCODING_SAMPLE_BYTES])
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            pending = ""
+            # Halaman yang sudah didekode dilepas lagi, agar RSS tidak tumbuh sebesar file
+            release = hasattr(mmap, "MADV_DONTNEED") and chunk_bytes % mmap.PAGESIZE == 0
+            for position in range(0, len(mapped), chunk_bytes):
+                final = position + chunk_bytes >= len(mapped)
+                pending += decoder.decode(mapped[position:position + chunk_bytes], final=final)
+                if release:
+                    mapped.madvise(mmap.MADV_DONTNEED, position, min(chunk_bytes, len(mapped) - position))
+                # \r di akhir potongan bisa menjadi bagian dari \r\n di potongan berikutnya
+                cut = len(pending) if final else last_sentence_boundary(pending.rstrip("\r"))
+                if not final and cut == 0 and len(pending) < 4 * chunk_bytes:
+                    continue  # Belum ada batas kalimat; kumpulkan potongan berikutnya
+                if cut == 0:
+                    cut = len(pending.rstrip("\r")) or len(pending)
+                text, pending = pending[:cut], pending[cut:]
+                if text:
+                    yield text.replace("\r\n", "\n").replace("\r", "\n")
+
+# Fungsi untuk membaca file teks (encoding dideteksi otomatis, byte yang rusak tidak membuat gagal)
+def read_txt_file(filepath):
+    return "".join(iter_txt_chunks(filepath))
+
+# Fungsi untuk membaca file DOCX
+def read_docx_file(filepath):
+    from docx import Document
+    doc = Document(filepath)
+    return "\n".join([paragraph.text for paragraph in doc.paragraphs])
+
+# Fungsi untuk membaca halaman PDF satu per satu (generator)
+# Menghasilkan (nomor halaman, jumlah halaman, teks) untuk halaman `start_page` sampai sebelum `end_page`
+# `pdf_reader` boleh diberikan jika file sudah dibuka, agar PDF tidak di-parse dua kali
+def iter_pdf_pages(filepath, start_page=0, end_page=None, pdf_reader=None):
+    if pdf_reader is None:
+        pdf_reader = open_pdf(filepath)
+    page_count = len(pdf_reader.pages)
+    end_page = page_count if end_page is None else min(end_page, page_count)
+    for index in range(start_page, end_page):
+        yield index, page_count, pdf_reader.pages[index].extract_text() or ""
+
+# Fungsi untuk mengekstrak satu rentang halaman PDF (dijalankan di proses worker)
+def extract_pdf_page_range(filepath, start_page, end_page):
+    return [text for _, _, text in iter_pdf_pages(filepath, start_page, end_page)]
+
+# Fungsi untuk memilih cara memulai proses worker
+# forkserver/spawn menghindari fork dari proses yang sudah punya banyak thread (Streamlit, antrean ingest)
+def process_pool_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+# Fungsi untuk mengekstrak halaman PDF `start_page` sampai sebelum `end_page` secara paralel,
+# hasil tetap berurutan sesuai halaman
+def iter_pdf_pages_parallel(filepath, page_count, workers, start_page=0, end_page=None):
+    end_page = page_count if end_page is None else min(end_page, page_count)
+    range_size = max(1, -(-(end_page - start_page) // (workers * PDF_RANGES_PER_WORKER)))
+    starts = list(range(start_page, end_page, range_size))
+    ends = [min(start + range_size, end_page) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context()) as pool:
+        results = pool.map(extract_pdf_page_range, [filepath] * len(starts), starts, ends)
+        for start, texts in zip(starts, results):
+            for offset, text in enumerate(texts):
+                yield start + offset, page_count, text
+
+# Fungsi untuk membuka file PDF
+def open_pdf(filepath):
+    from PyPDF2 import PdfReader
+    return PdfReader(filepath)
+
+# Fungsi untuk menghitung jumlah halaman PDF
+def count_pdf_pages(filepath):
+    return len(open_pdf(filepath).pages)
+
+# Fungsi untuk membaca file PDF
+# `on_page(index, page_count, text)` dipanggil setiap kali satu halaman selesai diekstrak
+# `start_page`/`end_page` membatasi rentang halaman (dari 0, `end_page` tidak ikut); dengan `max_chars`
+# halaman diekstrak berurutan dan berhenti begitu batas karakter tercapai, sisa halaman tidak di-parse
+def read_pdf_file(filepath, on_page=None, start_page=0, end_page=None, max_chars=None):
+    workers = PDF_EXTRACTION_WORKERS or os.cpu_count() or 1
+    pdf_reader = open_pdf(filepath)
+    page_count = len(pdf_reader.pages)
+    end_page = page_count if end_page is None else min(end_page, page_count)
+    if workers > 1 and max_chars is None and end_page - start_page >= PARALLEL_PDF_MIN_PAGES:
+        page_iterator = iter_pdf_pages_parallel(filepath, page_count, workers, start_page, end_page)
+    else:
+        page_iterator = iter_pdf_pages(filepath, start_page, end_page, pdf_reader=pdf_reader)
+    pages = []
+    used_chars = -1  # Halaman digabung dengan "\n", jadi halaman pertama tidak menambah pemisah
+    for index, page_count, text in page_iterator:
+        pages.append(text)
+        used_chars += len(text) + 1
+        if on_page is not None:
+            on_page(index, page_count, text)
+        if max_chars is not None and used_chars >= max_chars:
+            break
+    return "\n".join(pages)[:max_chars]
+
+# Fungsi untuk membaca isi file berdasarkan ekstensi (lihat DOCUMENT_FORMATS)
+# File .txt dibaca langsung; parsing PDF/DOCX yang mahal melewati cache teks
+# `start_page`, `end_page`, dan `max_chars` membatasi teks yang dibaca (lihat read_pdf_file); rentang halaman
+# hanya untuk format dengan `limits`, format lain dibaca utuh lalu dipotong `max_chars`
+@timed("read_file")
+def read_file(filepath, on_page=None, start_page=0, end_page=None, max_chars=None):
+    extension = os.path.splitext(filepath)[1]
+    document_format = get_format(extension)
+    reader = resolve_backend(document_format["reader"])
+    args = (on_page,) if document_format["progress"] else ()
+    limits = {}
+    if start_page or end_page is not None or max_chars is not None:
+        if not document_format["limits"]:
+            if start_page or end_page is not None:
+                raise ValueError(f"Page ranges are not supported for '{extension}' files.")
+            return read_file(filepath, on_page)[:max_chars]
+        limits = {"start_page": start_page, "end_page": end_page, "max_chars": max_chars}
+    if document_format["cached"]:
+        # Setiap batas disimpan sebagai entri cache tersendiri
+        key_suffix = "".join(f"-{name}{value}" for name, value in limits.items())
+        return cached_read(filepath, reader, *args, key_suffix=key_suffix, **limits)
+    return reader(filepath, *args, **limits)
+
+# Fungsi untuk menyimpan teks sebagai file .txt
+@timed("save_text_to_txt")
+def save_text_to_txt(folder, filename, content):
+    os.makedirs(folder, exist_ok=True)  # Buat folder jika belum ada
+    if not filename.endswith(".txt"):
+        filename += ".txt"  # Pastikan file memiliki ekstensi .txt
+    filepath = os.path.join(folder, filename)
+    with open(filepath, "w", encoding="utf-8") as file:
+        file.write(content)
+    return filepath
+
+# Fungsi untuk menyimpan teks sebagai file .docx
+@timed("save_text_to_docx")
+def save_text_to_docx(folder, filename, content):
+    os.makedirs(folder, exist_ok=True)  # Buat folder jika belum ada
+    if not filename.endswith(".docx"):
+        filename += ".docx"  # Pastikan file memiliki ekstensi .docx
+    filepath = os.path.join(folder, filename)
+    from docx import Document
+    doc = Document()
+    doc.add_paragraph(content)
+    doc.save(filepath)
+    return filepath
+
+# Fungsi untuk menyimpan teks sebagai file .pdf (baris panjang dibungkus, lihat pdf_writer)
+@timed("save_text_to_pdf")
+def save_text_to_pdf(folder, filename, content):
+    os.makedirs(folder, exist_ok=True)  # Buat folder jika belum ada
+    if not filename.endswith(".pdf"):
+        filename += ".pdf"  # Pastikan file memiliki ekstensi .pdf
+    filepath = os.path.join(folder, filename)
+    from pdf_writer import write_text_pdf
+    write_text_pdf(filepath, content)
+    return filepath
+
+# Fungsi utama untuk menyimpan dokumen berdasarkan format pilihan
+def save_document(folder, filename, content, format_choice):
+    writer = get_format(format_choice)["writer"]
+    if writer is None:
+        raise ValueError(f"Format '{format_choice}' cannot be written. Choose from {', '.join(writable_formats())}.")
+    return resolve_backend(writer)(folder, filename, content)
+
+# Format bawaan
+register_format("txt", read_txt_file, save_text_to_txt, cached=False)
+register_format("pdf", read_pdf_file, save_text_to_pdf, progress=True, page_counter=count_pdf_pages, limits=True)
+register_format("docx", read_docx_file, save_text_to_docx)
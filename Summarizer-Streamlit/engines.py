@@ -0,0 +1,102 @@
+import numpy as np
+from scipy import sparse
+
+# Parameter TextRank
+DAMPING = 0.85
+CONVERGENCE_THRESHOLD = 1e-6
+MAX_ITERATIONS = 100
+# Kemiripan kosinus di bawah batas ini tidak dijadikan sisi graf (menjaga graf tetap jarang)
+SIMILARITY_THRESHOLD = 0.05
+# Setiap kalimat hanya terhubung ke sekian tetangga paling mirip, jadi jumlah sisi O(N * k), bukan O(N^2)
+GRAPH_NEIGHBOURS = 20
+# Kemiripan dihitung per blok baris; jumlah sel (baris x N) dan jumlah baris per blok dibatasi agar memori tetap kecil
+GRAPH_BLOCK_ENTRIES = 4 * 1024 * 1024
+GRAPH_BLOCK_ROWS = 512
+
+
+# Engine bawaan: skor kalimat = jumlah bobot TF-IDF pada barisnya
+def tfidf_scores(tf_idf_matrix):
+    return np.asarray(tf_idf_matrix.sum(axis=1)).ravel()
+
+
+# Fungsi untuk membangun graf kemiripan antar kalimat (k tetangga terdekat) sebagai matriks sparse
+# Baris TF-IDF sudah dinormalisasi L2, sehingga X @ X.T adalah kemiripan kosinus; produk ini dihitung
+# per blok baris dan hanya `neighbours` sisi terkuat per baris yang disimpan, lalu graf dibuat simetris
+def similarity_graph(tf_idf_matrix, threshold=SIMILARITY_THRESHOLD, neighbours=GRAPH_NEIGHBOURS,
+                     block_entries=GRAPH_BLOCK_ENTRIES):
+    matrix = sparse.csr_matrix(tf_idf_matrix, dtype=np.float32)  # float32 cukup untuk memilih tetangga
+    n = matrix.shape[0]
+    columns = matrix.tocsc()
+    block_rows = max(1, min(GRAPH_BLOCK_ROWS, block_entries // max(n, 1)))
+    keep = min(neighbours, n - 1)
+    rows, cols, values = [], [], []
+    for start in range(0, n, block_rows):
+        end = min(n, start + block_rows)
+        # Hanya kolom (kata) yang muncul di blok ini yang ikut dihitung: sparse (N x kata) @ padat (kata x blok)
+        block_matrix = matrix[start:end]
+        terms = np.unique(block_matrix.indices)
+        block = np.ascontiguousarray((columns[:, terms] @ block_matrix[:, terms].T.toarray()).T)
+        block[np.arange(end - start), np.arange(start, end)] = 0  # Tanpa sisi ke diri sendiri
+        if keep <= 0:
+            continue
+        if keep < n - 1:
+            top = np.argpartition(-block, keep - 1, axis=1)[:, :keep]
+        else:
+            top = np.broadcast_to(np.arange(n), block.shape)
+        top_values = np.take_along_axis(block, top, axis=1)
+        mask = top_values >= max(threshold, np.finfo(np.float32).tiny)
+        rows.append(np.nonzero(mask)[0] + start)
+        cols.append(top[mask])
+        values.append(top_values[mask].astype(np.float64))
+    if not rows:
+        return sparse.csr_matrix((n, n))
+    graph = sparse.csr_matrix(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n)
+    )
+    return graph.maximum(graph.T).tocsr()
+
+
+# Engine TextRank/LexRank: PageRank dengan iterasi pangkat tervektorisasi di atas graf sparse
+def textrank_scores(tf_idf_matrix, damping=DAMPING, tol=CONVERGENCE_THRESHOLD, max_iter=MAX_ITERATIONS):
+    n = tf_idf_matrix.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    graph = similarity_graph(tf_idf_matrix)
+
+    # Normalisasi baris menjadi matriks transisi; kalimat tanpa sisi dibagi rata ke semua kalimat
+    out_weight = np.asarray(graph.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    inverse = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    transition_t = (sparse.diags(inverse) @ graph).T.tocsr()
+
+    ranks = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        dangling_mass = ranks[dangling].sum() / n
+        new_ranks = (1 - damping) / n + damping * (transition_t @ ranks + dangling_mass)
+        converged = np.abs(new_ranks - ranks).sum() < tol
+        ranks = new_ranks
+        if converged:
+            break
+    return ranks
+
+
+# Daftar engine yang bisa dipilih dari kode maupun sidebar
+SUMMARIZER_ENGINES = {
+    "tfidf": tfidf_scores,
+    "textrank": textrank_scores,
+}
+
+DEFAULT_ENGINE = "tfidf"
+
+
+# Fungsi untuk mendaftarkan engine baru: fungsi(tf_idf_matrix) -> skor per kalimat
+def register_engine(name, score_function):
+    SUMMARIZER_ENGINES[name] = score_function
+
+
+# Fungsi untuk mengambil engine berdasarkan nama
+def get_engine(name=DEFAULT_ENGINE):
+    try:
+        return SUMMARIZER_ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown summarizer engine '{name}'. Choose from {', '.join(SUMMARIZER_ENGINES)}.")
@@ -0,0 +1,45 @@
+import os
+
+from export_summaries import EXPORT_FOLDER, export_summaries
+from job_queue import FAILED, QUEUED, JobQueue
+
+# Jumlah ekspor yang berjalan bersamaan; ekspor lain menunggu di antrean
+EXPORT_WORKERS = 1
+
+# Status pekerjaan ekspor (QUEUED dan FAILED dari job_queue)
+RUNNING = "running"
+DONE = "done"
+
+
+# Antrean ekspor di latar belakang: halaman tetap responsif dan kemajuan dibaca dari status pekerjaan
+# Setiap pekerjaan menulis ke file sendiri, jadi ekspor dari sesi yang berbeda tidak saling menimpa
+class ExportQueue(JobQueue):
+    finished_statuses = (DONE, FAILED)
+
+    def __init__(self, workers=EXPORT_WORKERS, folder=EXPORT_FOLDER):
+        super().__init__(workers, "export")
+        self.folder = folder
+
+    # Tambahkan ekspor ke antrean dan kembalikan id pekerjaan
+    # `options` diteruskan ke export_summaries (corpus_model, length, engine, diversity, stemming, ...)
+    def submit(self, documents_folder, export_format, **options):
+        fields = {"path": None, "done": 0, "total": 0, "name": None, "exported": None}
+        return self._submit(fields, documents_folder, export_format, options)
+
+    def _run(self, job_id, documents_folder, export_format, options):
+        def on_progress(done, total, name):
+            self._update(job_id, done=done, total=total, name=name)
+
+        output_path = os.path.join(self.folder, f"summaries-{job_id[:12]}.{export_format}")
+        try:
+            self._update(job_id, status=RUNNING, path=output_path)
+            exported = export_summaries(
+                documents_folder, output_path, export_format=export_format, on_progress=on_progress, **options
+            )
+            self._update(job_id, status=DONE, exported=exported)
+        except Exception as error:
+            self._update(job_id, status=FAILED, error=f"{type(error).__name__}: {error}")
+
+
+# Antrean bersama untuk seluruh sesi server
+export_queue = ExportQueue()
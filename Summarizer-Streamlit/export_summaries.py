@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import time
+
+from documents import DOCUMENTS_FOLDER, iter_txt_chunks, load_document_files, read_file
+from engines import DEFAULT_ENGINE, SUMMARIZER_ENGINES
+from stream_summarizer import LARGE_TEXT_BYTES, rank_large_text_file
+from summarizer import DEFAULT_DIVERSITY, DEFAULT_SUMMARY_LENGTH, DEFAULT_VECTORIZER, VECTORIZER_MODES
+from summary_cache import cached_rank_sentence_spans
+
+# Folder tujuan ekspor dari aplikasi
+EXPORT_FOLDER = "exports"
+
+# Jumlah ringkasan yang ditahan di memori sebelum ditulis (satu row group Parquet per batch)
+EXPORT_BATCH_DOCUMENTS = 64
+
+# Kolom hasil ekspor, dalam urutan yang sama untuk JSONL dan Parquet
+EXPORT_COLUMNS = [
+    "document", "format", "size_bytes", "modified", "characters", "summary_sentences", "summary",
+    "engine", "length", "status", "error", "seconds",
+]
+
+
+# Penulis JSONL: satu baris JSON per dokumen
+class JsonlExportWriter:
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write_batch(self, records):
+        self.file.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# Penulis Parquet: setiap batch menjadi satu row group, jadi hanya satu batch yang ada di memori
+# pandas dan pyarrow baru di-import saat ekspor Parquet dipakai
+class ParquetExportWriter:
+    def __init__(self, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.schema = pa.schema([
+            ("document", pa.string()),
+            ("format", pa.string()),
+            ("size_bytes", pa.int64()),
+            ("modified", pa.string()),
+            ("characters", pa.int64()),
+            ("summary_sentences", pa.int64()),
+            ("summary", pa.string()),
+            ("engine", pa.string()),
+            ("length", pa.string()),
+            ("status", pa.string()),
+            ("error", pa.string()),
+            ("seconds", pa.float64()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema, compression="snappy")
+
+    def write_batch(self, records):
+        import pandas as pd
+        import pyarrow as pa
+        frame = pd.DataFrame.from_records(records, columns=EXPORT_COLUMNS)
+        self.writer.write_table(pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        self.writer.close()
+
+
+# Format ekspor: nama -> kelas penulis
+EXPORT_FORMATS = {
+    "jsonl": JsonlExportWriter,
+    "parquet": ParquetExportWriter,
+}
+
+
+# Fungsi untuk menentukan format ekspor dari pilihan atau ekstensi file output
+def resolve_export_format(output_path, export_format=None):
+    export_format = (export_format or os.path.splitext(output_path)[1]).lower().lstrip(".")
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{export_format}'. Choose from {', '.join(EXPORT_FORMATS)}.")
+    return export_format
+
+
+# Fungsi untuk meringkas satu dokumen menjadi satu baris ekspor; kesalahan dicatat di baris, tidak menghentikan ekspor
+# Teks PDF/DOCX diambil dari cache teks dan ringkasan dari cache ringkasan jika sudah pernah dibuat
+def summarize_record(folder, filename, corpus_model=None, length=DEFAULT_SUMMARY_LENGTH, engine=DEFAULT_ENGINE,
+                     diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER, stemming=False):
+    started = time.perf_counter()
+    filepath = os.path.join(folder, filename)
+    record = dict.fromkeys(EXPORT_COLUMNS)
+    record.update({
+        "document": filename,
+        "format": os.path.splitext(filename)[1][1:].lower(),
+        "engine": engine,
+        "length": str(length),
+    })
+    try:
+        stat = os.stat(filepath)
+        record["size_bytes"] = stat.st_size
+        record["modified"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(stat.st_mtime))
+        # File teks yang sangat besar diringkas streaming dengan IDF lokal, juga saat model korpus diberikan:
+        # membaca seluruh teks ke memori hanya demi IDF korpus tidak sepadan untuk file sebesar ini
+        if record["format"] == "txt" and engine == "tfidf" and stat.st_size >= LARGE_TEXT_BYTES:
+            sentences = [sentence for _, _, sentence in rank_large_text_file(filepath, length, diversity, stemming)]
+            record["characters"] = sum(len(chunk) for chunk in iter_txt_chunks(filepath))
+        else:
+            text, spans = cached_rank_sentence_spans(
+                read_file(filepath), corpus_model, length, engine, diversity, vectorizer, stemming
+            )
+            record["characters"] = len(text)
+            sentences = [text[start:end] for start, end in spans]
+        record["summary_sentences"] = len(sentences)
+        record["summary"] = " ".join(sentences)
+        record["status"] = "ok"
+    except Exception as error:
+        record["status"] = "error"
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+# Fungsi utama: ringkas semua dokumen di folder dan tulis ke JSONL atau Parquet per batch
+# Hanya satu batch ringkasan yang disimpan di memori; file ditulis ke .tmp lalu diganti secara atomik
+# `on_progress(selesai, total, nama dokumen)` dipanggil setelah setiap dokumen
+# Mengembalikan jumlah dokumen yang diekspor
+def export_summaries(folder, output_path, export_format=None, corpus_model=None, length=DEFAULT_SUMMARY_LENGTH,
+                     engine=DEFAULT_ENGINE, diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER,
+                     stemming=False, batch_size=EXPORT_BATCH_DOCUMENTS, on_progress=None):
+    writer_class = EXPORT_FORMATS[resolve_export_format(output_path, export_format)]
+    filenames = load_document_files(folder)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    writer = writer_class(tmp_path)
+    try:
+        batch = []
+        for done, filename in enumerate(filenames, 1):
+            batch.append(summarize_record(
+                folder, filename, corpus_model, length, engine, diversity, vectorizer, stemming
+            ))
+            if len(batch) == batch_size:
+                writer.write_batch(batch)
+                batch = []
+            if on_progress:
+                on_progress(done, len(filenames), filename)
+        if batch:
+            writer.write_batch(batch)
+        writer.close()
+    except BaseException:
+        writer.close()
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, output_path)
+    return len(filenames)
+
+
+def main():
+    from batch_summarize import parse_length
+
+    parser = argparse.ArgumentParser(description="Export the summary of every document in a folder as JSONL or Parquet.")
+    parser.add_argument("folder", nargs="?", default=DOCUMENTS_FOLDER, help="Folder containing the documents.")
+    parser.add_argument("-o", "--output", default=os.path.join(EXPORT_FOLDER, "summaries.jsonl"),
+                        help="Output file; the format follows the extension (.jsonl or .parquet).")
+    parser.add_argument("-f", "--format", choices=list(EXPORT_FORMATS), default=None,
+                        help="Output format (default: from the output file extension).")
+    parser.add_argument("-e", "--engine", choices=list(SUMMARIZER_ENGINES), default=DEFAULT_ENGINE, help="Summarizer engine.")
+    parser.add_argument("-n", "--length", type=parse_length, default=DEFAULT_SUMMARY_LENGTH,
+                        help="Summary length: a sentence count (e.g. 5) or a ratio (e.g. 0.2).")
+    parser.add_argument("--diversity", type=float, default=DEFAULT_DIVERSITY, help="MMR diversity weight (0-1).")
+    parser.add_argument("--corpus-idf", action="store_true", help="Use the corpus-wide IDF model of the folder.")
+    parser.add_argument("--vectorizer", choices=list(VECTORIZER_MODES), default=DEFAULT_VECTORIZER,
+                        help="Local IDF vectorizer; 'hashing' keeps vocabulary memory constant for very large files.")
+    parser.add_argument("--stem", action="store_true",
+                        help="Stem Indonesian words before vectorizing (uses local IDF instead of --corpus-idf).")
+    parser.add_argument("-b", "--batch-size", type=int, default=EXPORT_BATCH_DOCUMENTS,
+                        help="Summaries held in memory before each write.")
+    args = parser.parse_args()
+
+    corpus_model = None
+    if args.corpus_idf:
+        from corpus_model import get_corpus_model
+        corpus_model = get_corpus_model(args.folder)
+
+    def show_progress(done, total, filename):
+        print(f"[{done}/{total}] {filename}")
+
+    exported = export_summaries(
+        args.folder,
+        args.output,
+        export_format=args.format,
+        corpus_model=corpus_model,
+        length=args.length,
+        engine=args.engine,
+        diversity=args.diversity,
+        vectorizer=args.vectorizer,
+        stemming=args.stem,
+        batch_size=args.batch_size,
+        on_progress=show_progress,
+    )
+    print(f"{exported} document summaries exported to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from documents import read_file
+from engines import DEFAULT_ENGINE, SUMMARIZER_ENGINES, get_engine
+from instrumentation import stage
+from segmenter import sentence_spans
+from summarizer import (
+    DEFAULT_DIVERSITY,
+    DEFAULT_SUMMARY_LENGTH,
+    DEFAULT_VECTORIZER,
+    VECTORIZER_MODES,
+    local_tf_idf_matrix,
+    resolve_summary_length,
+    select_sentences,
+)
+
+# Jumlah kalimat per bagian pada tahap map
+DEFAULT_SECTION_SENTENCES = 2000
+
+# Jumlah ringkasan bagian yang digabung dalam satu langkah reduce
+DEFAULT_FAN_OUT = 8
+
+
+# Pekerjaan di proses worker: pilih `count` kalimat terbaik dari satu kelompok kalimat
+# Mengembalikan indeks lokal dalam urutan dokumen
+def rank_group(sentences, count, engine, diversity, vectorizer):
+    if not sentences:
+        return []
+    tf_idf_matrix = local_tf_idf_matrix(sentences, vectorizer)
+    scores = get_engine(engine)(tf_idf_matrix)
+    return select_sentences(tf_idf_matrix, scores, count, diversity).tolist()
+
+
+# Fungsi untuk menjalankan rank_group pada setiap kelompok; urutan hasil selalu sama dengan urutan kelompok
+def _rank_groups(pool, groups, count, engine, diversity, vectorizer):
+    jobs = [([sentence for _, sentence in group], count, engine, diversity, vectorizer) for group in groups]
+    if pool is None:
+        results = [rank_group(*job) for job in jobs]
+    else:
+        results = list(pool.map(rank_group, *zip(*jobs)))
+    return [[group[index] for index in chosen] for group, chosen in zip(groups, results)]
+
+
+# Ringkasan hierarkis (map-reduce): dokumen dipecah menjadi bagian berisi `section_sentences` kalimat,
+# setiap bagian diringkas secara paralel, lalu ringkasan bagian digabung per `fan_out` dan diringkas lagi
+# sampai tersisa satu kelompok. Hasil tidak bergantung pada jumlah worker.
+# Mengembalikan (teks, daftar span terpilih dalam urutan dokumen) seperti rank_sentence_spans
+def hierarchical_rank_sentence_spans(text, length=DEFAULT_SUMMARY_LENGTH, engine=DEFAULT_ENGINE,
+                                     diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER,
+                                     section_sentences=DEFAULT_SECTION_SENTENCES, fan_out=DEFAULT_FAN_OUT,
+                                     workers=None):
+    get_engine(engine)  # Validasi nama engine sebelum pekerjaan dikirim ke worker
+    if section_sentences < 1 or fan_out < 2:
+        raise ValueError("section_sentences must be at least 1 and fan_out at least 2.")
+    with stage("segment"):
+        spans = sentence_spans(text)
+    if not spans:
+        return text, []
+    # Rasio dihitung terhadap seluruh dokumen, lalu setiap tahap memakai jumlah kalimat yang sama
+    count = resolve_summary_length(length, len(spans))
+
+    # Setiap kalimat dibawa bersama indeks globalnya
+    sentences = [(index, text[start:end]) for index, (start, end) in enumerate(spans)]
+    groups = [sentences[i:i + section_sentences] for i in range(0, len(sentences), section_sentences)]
+
+    pool = ProcessPoolExecutor(max_workers=workers) if len(groups) > 1 and workers != 1 else None
+    try:
+        with stage("map", sections=len(groups)):
+            summaries = _rank_groups(pool, groups, count, engine, diversity, vectorizer)
+        level = 0
+        while len(summaries) > 1:
+            level += 1
+            groups = [
+                [sentence for summary in summaries[i:i + fan_out] for sentence in summary]
+                for i in range(0, len(summaries), fan_out)
+            ]
+            with stage("reduce", level=level, groups=len(groups)):
+                summaries = _rank_groups(pool, groups, count, engine, diversity, vectorizer)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Satu bagian saja (dokumen pendek) sudah sama dengan ringkasan biasa dengan IDF lokal
+    return text, [spans[index] for index, _ in summaries[0]]
+
+
+# Fungsi untuk menghitung ringkasan hierarkis sebagai teks
+def compute_hierarchical_summary(text, length=DEFAULT_SUMMARY_LENGTH, engine=DEFAULT_ENGINE,
+                                 diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER,
+                                 section_sentences=DEFAULT_SECTION_SENTENCES, fan_out=DEFAULT_FAN_OUT,
+                                 workers=None):
+    text, summary_spans = hierarchical_rank_sentence_spans(
+        text, length, engine, diversity, vectorizer, section_sentences, fan_out, workers
+    )
+    return ' '.join(text[start:end] for start, end in summary_spans)
+
+
+# Fungsi untuk membaca argumen rentang halaman "10-40" (mulai dari 1, inklusif) menjadi (start_page, end_page)
+def parse_page_range(value):
+    first, _, last = value.partition("-")
+    try:
+        start_page = int(first) - 1 if first else 0
+        end_page = int(last) if last else (None if "-" in value else start_page + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid page range '{value}'.")
+    if start_page < 0 or (end_page is not None and end_page <= start_page):
+        raise argparse.ArgumentTypeError(f"Invalid page range '{value}'.")
+    return start_page, end_page
+
+
+def main():
+    from batch_summarize import parse_length
+
+    parser = argparse.ArgumentParser(description="Summarize one long document with map-reduce over sections.")
+    parser.add_argument("document", help="Path to a .txt, .pdf or .docx file.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    parser.add_argument("-s", "--section-sentences", type=int, default=DEFAULT_SECTION_SENTENCES,
+                        help="Sentences per section in the map step.")
+    parser.add_argument("-f", "--fan-out", type=int, default=DEFAULT_FAN_OUT,
+                        help="Section summaries merged per reduce step.")
+    parser.add_argument("-e", "--engine", choices=list(SUMMARIZER_ENGINES), default=DEFAULT_ENGINE, help="Summarizer engine.")
+    parser.add_argument("-n", "--length", type=parse_length, default=DEFAULT_SUMMARY_LENGTH,
+                        help="Summary length: a sentence count (e.g. 5) or a ratio (e.g. 0.2).")
+    parser.add_argument("--diversity", type=float, default=DEFAULT_DIVERSITY, help="MMR diversity weight (0-1).")
+    parser.add_argument("--vectorizer", choices=list(VECTORIZER_MODES), default=DEFAULT_VECTORIZER,
+                        help="Local IDF vectorizer used in every step.")
+    parser.add_argument("--pages", type=parse_page_range, default=(0, None),
+                        help="PDF page range to summarize, 1-based and inclusive (e.g. 10-40 or 10-).")
+    parser.add_argument("--max-chars", type=int, default=None,
+                        help="Stop reading the document after this many characters.")
+    args = parser.parse_args()
+
+    start_page, end_page = args.pages
+    print(compute_hierarchical_summary(
+        read_file(args.document, start_page=start_page, end_page=end_page, max_chars=args.max_chars),
+        length=args.length,
+        engine=args.engine,
+        diversity=args.diversity,
+        vectorizer=args.vectorizer,
+        section_sentences=args.section_sentences,
+        fan_out=args.fan_out,
+        workers=args.workers,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+from engines import DEFAULT_ENGINE, get_engine
+from instrumentation import stage
+from segmenter import sentence_spans
+from summarizer import DEFAULT_DIVERSITY, DEFAULT_SUMMARY_LENGTH, build_analyzer, select_sentences
+
+
+# Fungsi untuk mencari panjang awalan yang sama dari dua teks (pencarian biner atas perbandingan slice)
+def common_prefix_length(a, b):
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+# Fungsi untuk mencari panjang akhiran yang sama, tanpa melewati `limit` karakter
+def common_suffix_length(a, b, limit):
+    low, high = 0, min(len(a), len(b), limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle:] == b[len(b) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+# Peringkas inkremental: saat teks diedit, hanya kalimat di sekitar bagian yang berubah
+# yang disegmentasi dan divektorisasi ulang; statistik term diperbarui di tempat
+# IDF dihitung per dokumen (sama seperti TfidfVectorizer tanpa model korpus)
+class IncrementalSummarizer:
+    def __init__(self, stemming=False):
+        self.stemming = stemming
+        self.text = ""
+        self.spans = []
+        # Per kalimat: (indeks term, jumlah kemunculan)
+        self.rows = []
+        self.vocabulary = {}
+        self.document_frequency = np.zeros(0, dtype=np.int64)
+        self._analyzer = build_analyzer(stemming)
+
+    def _vectorize(self, sentence):
+        counts = Counter(self._analyzer(sentence))
+        indices = np.empty(len(counts), dtype=np.int64)
+        for position, term in enumerate(counts):
+            index = self.vocabulary.get(term)
+            if index is None:
+                index = self.vocabulary[term] = len(self.vocabulary)
+            indices[position] = index
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        return indices, values
+
+    def _add_frequencies(self, rows, delta):
+        if len(self.vocabulary) > len(self.document_frequency):
+            grown = np.zeros(len(self.vocabulary), dtype=np.int64)
+            grown[:len(self.document_frequency)] = self.document_frequency
+            self.document_frequency = grown
+        for indices, _ in rows:
+            self.document_frequency[indices] += delta
+
+    # Buang term yang tidak lagi muncul di kalimat mana pun (misalnya setelah berpindah ke dokumen lain),
+    # agar kosakata dan vektor IDF tidak tumbuh terus; baru dijalankan jika term mati lebih dari separuh kosakata
+    def _compact(self):
+        alive = self.document_frequency > 0
+        if 2 * int(alive.sum()) >= len(alive):
+            return
+        new_index = np.cumsum(alive) - 1  # Urutan term tetap, jadi hasil TF-IDF tidak berubah
+        self.vocabulary = {term: int(new_index[index]) for term, index in self.vocabulary.items() if alive[index]}
+        self.document_frequency = self.document_frequency[alive]
+        self.rows = [(new_index[indices], values) for indices, values in self.rows]
+
+    # Perbarui status terhadap teks baru; mengembalikan jumlah kalimat yang divektorisasi ulang
+    def update(self, text):
+        old_text, old_spans, old_rows = self.text, self.spans, self.rows
+        if text == old_text:
+            return 0
+
+        with stage("segment", incremental=True):
+            prefix = common_prefix_length(old_text, text)
+            suffix = common_suffix_length(old_text, text, min(len(old_text), len(text)) - prefix)
+            old_edit_end = len(old_text) - suffix
+            shift = len(text) - len(old_text)
+
+            # Kalimat lama yang utuh sebelum/sesudah bagian yang diedit; satu kalimat di setiap tepi
+            # tetap diproses ulang karena batas kalimat bisa bergantung pada teks di sekitarnya
+            keep_before = 0
+            while keep_before < len(old_spans) and old_spans[keep_before][1] < prefix:
+                keep_before += 1
+            keep_before = max(0, keep_before - 1)
+            keep_after = len(old_spans)
+            while keep_after > keep_before and old_spans[keep_after - 1][0] > old_edit_end:
+                keep_after -= 1
+            keep_after = min(len(old_spans), keep_after + 1)
+
+            window_start = old_spans[keep_before][0] if keep_before < len(old_spans) else len(old_text)
+            window_start = min(window_start, prefix)
+            window_end = old_spans[keep_after][0] + shift if keep_after < len(old_spans) else len(text)
+            window_spans = sentence_spans(text, window_start, window_end)
+
+        with stage("vectorize", sentences=len(window_spans), incremental=True):
+            # Kalimat di jendela yang isinya sama dengan kalimat lama tidak perlu ditokenisasi ulang
+            reusable = {}
+            for (start, end), row in zip(old_spans[keep_before:keep_after], old_rows[keep_before:keep_after]):
+                reusable.setdefault(old_text[start:end], row)
+            removed_rows = old_rows[keep_before:keep_after]
+            window_rows = []
+            vectorized = 0
+            for start, end in window_spans:
+                row = reusable.get(text[start:end])
+                if row is None:
+                    row = self._vectorize(text[start:end])
+                    vectorized += 1
+                window_rows.append(row)
+            self._add_frequencies(removed_rows, -1)
+            self._add_frequencies(window_rows, 1)
+
+        suffix_spans = [(start + shift, end + shift) for start, end in old_spans[keep_after:]]
+        self.text = text
+        self.spans = old_spans[:keep_before] + window_spans + suffix_spans
+        self.rows = old_rows[:keep_before] + window_rows + old_rows[keep_after:]
+        self._compact()
+        return vectorized
+
+    # Matriks TF-IDF (sama dengan TfidfVectorizer: smooth IDF, normalisasi L2) dari baris yang tersimpan
+    def tf_idf_matrix(self):
+        n = len(self.rows)
+        lengths = np.fromiter((len(indices) for indices, _ in self.rows), dtype=np.int64, count=n)
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        indices = np.concatenate([row[0] for row in self.rows]) if n else np.zeros(0, dtype=np.int64)
+        values = np.concatenate([row[1] for row in self.rows]) if n else np.zeros(0)
+        idf = np.log((1 + n) / (1 + self.document_frequency)) + 1
+        counts = sparse.csr_matrix((values * idf[indices], indices, indptr), shape=(n, len(self.vocabulary)))
+        if not self.vocabulary:
+            return counts  # Kosakata kosong: select_sentences menghasilkan ringkasan kosong
+        return normalize(counts, norm="l2")
+
+    # Sama seperti summarizer.rank_sentence_spans, tetapi memakai status inkremental
+    def rank_sentence_spans(self, text, length=DEFAULT_SUMMARY_LENGTH, engine=DEFAULT_ENGINE,
+                            diversity=DEFAULT_DIVERSITY):
+        score_sentences = get_engine(engine)
+        self.update(text)
+        if not self.spans:
+            return text, []
+        with stage("rank", engine=engine, incremental=True):
+            tf_idf_matrix = self.tf_idf_matrix()
+            chosen = select_sentences(tf_idf_matrix, score_sentences(tf_idf_matrix), length, diversity)
+        return text, [self.spans[index] for index in chosen.tolist()]
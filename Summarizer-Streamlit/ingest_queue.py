@@ -0,0 +1,48 @@
+import os
+
+from documents import read_file
+from job_queue import FAILED, QUEUED, JobQueue
+from upload_store import store_upload
+
+# Jumlah thread ingest; parsing PDF besar tetap bisa memakai proses paralel di read_pdf_file
+INGEST_WORKERS = 2
+
+# Status pekerjaan ingest (QUEUED dan FAILED dari job_queue)
+EXTRACTING = "extracting"
+INDEXED = "indexed"
+
+
+# Antrean ingest di latar belakang: simpan unggahan, ekstrak teks (mengisi cache), lalu perbarui indeks korpus
+class IngestQueue(JobQueue):
+    finished_statuses = (INDEXED, FAILED)
+
+    def __init__(self, workers=INGEST_WORKERS):
+        super().__init__(workers, "ingest")
+
+    # Tambahkan unggahan ke antrean dan kembalikan id pekerjaan
+    def submit(self, folder, filename, data):
+        return self._submit({"name": filename, "path": None}, folder, filename, data)
+
+    def _run(self, job_id, folder, filename, data):
+        filepath, created = None, False
+        try:
+            self._update(job_id, status=EXTRACTING)
+            filepath, created = store_upload(folder, filename, data)
+            self._update(job_id, path=filepath)
+            if not read_file(filepath).strip():
+                raise ValueError("The file contains no extractable text.")
+            # Import di sini agar modul ini tetap ringan bagi pemanggil yang tidak butuh indeks
+            from corpus_model import get_corpus_model
+            from search_index import get_search_index
+            get_corpus_model(folder)
+            get_search_index(folder).update()
+            self._update(job_id, status=INDEXED)
+        except Exception as error:
+            # Jangan tinggalkan file yang tidak bisa dibaca di folder dokumen
+            if created:
+                os.remove(filepath)
+            self._update(job_id, status=FAILED, error=f"{type(error).__name__}: {error}")
+
+
+# Antrean bersama untuk seluruh sesi server
+ingest_queue = IngestQueue()
@@ -0,0 +1,143 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Logger untuk baris log terstruktur (JSON) per tahap
+logger = logging.getLogger("summify.performance")
+
+# Atur SUMMIFY_PERF_LOG ke path file, atau "-" untuk stderr, agar log performa ditulis
+PERF_LOG_ENV = "SUMMIFY_PERF_LOG"
+
+# Atur SUMMIFY_TRACE_MEMORY=1 agar alokasi memori per tahap diukur (tracemalloc, sekali untuk seluruh proses)
+TRACE_MEMORY_ENV = "SUMMIFY_TRACE_MEMORY"
+
+_local = threading.local()
+
+# tracemalloc dan puncak memorinya berlaku untuk seluruh proses, jadi hanya satu thread (pemilik)
+# yang boleh me-reset puncak; tahap di thread lain selama itu dicatat tanpa alokasi memori
+_memory_lock = threading.Lock()
+_memory_owner = None
+
+
+# Fungsi untuk memasang handler log jika variabel lingkungan diatur
+def configure_logging():
+    destination = os.environ.get(PERF_LOG_ENV)
+    if not destination or logger.handlers:
+        return
+    handler = logging.StreamHandler() if destination == "-" else logging.FileHandler(destination, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
+configure_logging()
+
+
+# Fungsi untuk menyalakan tracemalloc sekali per proses jika variabel lingkungan diatur
+def configure_memory_tracing():
+    if os.environ.get(TRACE_MEMORY_ENV) == "1" and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+configure_memory_tracing()
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+# Fungsi untuk mulai mengumpulkan catatan tahap di thread ini (satu rerun Streamlit)
+def begin_collection():
+    _local.records = []
+    return _local.records
+
+
+# Fungsi untuk mengambil alih pengukuran memori untuk thread ini; False jika thread lain sedang mengukur
+def _acquire_memory():
+    global _memory_owner
+    with _memory_lock:
+        if _memory_owner is None:
+            _memory_owner = threading.get_ident()
+        return _memory_owner == threading.get_ident()
+
+
+def _release_memory():
+    global _memory_owner
+    with _memory_lock:
+        if _memory_owner == threading.get_ident():
+            _memory_owner = None
+
+
+# Context manager untuk mengukur waktu wall, waktu CPU, dan byte yang dialokasikan satu tahap
+@contextmanager
+def stage(name, **fields):
+    stack = _stack()
+    # Tahap bersarang mengikuti status tahap induknya; tahap teratas mencoba menjadi pemilik
+    if stack:
+        tracing = stack[-1]["tracing"]
+    else:
+        tracing = tracemalloc.is_tracing() and _acquire_memory()
+    frame = {"start_memory": 0, "peak_memory": 0, "tracing": tracing}
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1]["peak_memory"] = max(stack[-1]["peak_memory"], peak)
+        tracemalloc.reset_peak()
+        frame["start_memory"] = frame["peak_memory"] = current
+    stack.append(frame)
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    try:
+        yield fields
+    finally:
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+        stack.pop()
+        allocated = None
+        if tracing and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            frame["peak_memory"] = max(frame["peak_memory"], peak)
+            allocated = frame["peak_memory"] - frame["start_memory"]
+            # Teruskan puncak memori ke tahap induk sebelum peak di-reset
+            if stack:
+                stack[-1]["peak_memory"] = max(stack[-1]["peak_memory"], frame["peak_memory"])
+            tracemalloc.reset_peak()
+        if tracing and not stack:
+            _release_memory()
+        record_stage(name, wall, cpu, allocated, depth=len(stack), **fields)
+
+
+# Fungsi untuk mencatat satu tahap ke log dan ke kumpulan catatan thread ini
+def record_stage(name, wall_seconds, cpu_seconds, allocated_bytes=None, **fields):
+    record = {
+        "stage": name,
+        "wall_ms": round(wall_seconds * 1000, 3),
+        "cpu_ms": round(cpu_seconds * 1000, 3),
+        "allocated_bytes": allocated_bytes,
+    }
+    record.update(fields)
+    records = getattr(_local, "records", None)
+    if records is not None:
+        records.append(record)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(record, ensure_ascii=False))
+    return record
+
+
+# Dekorator untuk mengukur seluruh pemanggilan fungsi sebagai satu tahap
+def timed(name):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,57 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Status yang sama untuk semua antrean
+QUEUED = "queued"
+FAILED = "failed"
+
+# Jumlah pekerjaan selesai yang statusnya tetap disimpan; yang paling lama dibuang lebih dulu
+MAX_FINISHED_JOBS = 1000
+
+
+# Dasar antrean pekerjaan di latar belakang (dipakai antrean ingest dan ekspor)
+# Subkelas mengisi `finished_statuses` dan `_run(job_id, ...)`; status dibaca halaman lewat status()/get()
+class JobQueue:
+    finished_statuses = (FAILED,)
+
+    def __init__(self, workers, thread_name_prefix, max_finished=MAX_FINISHED_JOBS):
+        self.max_finished = max_finished
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Daftarkan pekerjaan dengan status awal `fields`, jalankan `_run(job_id, *args)`, dan kembalikan id-nya
+    def _submit(self, fields, *args):
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = dict(fields, status=QUEUED, error=None)
+            self._prune()
+        self._pool.submit(self._run, job_id, *args)
+        return job_id
+
+    def _run(self, job_id, *args):
+        raise NotImplementedError
+
+    def _update(self, job_id, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    # Buang pekerjaan selesai yang paling lama di atas batas; pekerjaan yang masih berjalan selalu disimpan
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job["status"] in self.finished_statuses]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    # Ambil salinan status untuk daftar id pekerjaan (id yang sudah dibuang dilewati)
+    def status(self, job_ids):
+        with self._lock:
+            return [dict(self._jobs[job_id], id=job_id) for job_id in job_ids if job_id in self._jobs]
+
+    # Ambil salinan status satu pekerjaan (None jika id tidak dikenal atau sudah dibuang)
+    def get(self, job_id):
+        jobs = self.status([job_id]) if job_id else []
+        return jobs[0] if jobs else None
@@ -0,0 +1,188 @@
+import json
+import os
+import threading
+import time
+
+from documents import DOCUMENTS_FOLDER, document_extensions, get_format, read_file, resolve_backend
+from text_cache import hash_file
+
+# Lokasi manifest metadata dokumen
+MANIFEST_PATH = os.path.join(".cache", "manifest.json")
+
+# Folder dipindai ulang jika mtime folder berubah, atau paling lambat setelah sekian detik
+# (menimpa isi file yang sudah ada tidak mengubah mtime folder)
+RESCAN_SECONDS = 5.0
+
+# Selama detail diisi di latar belakang, manifest disimpan paling sering sekali per sekian detik
+DETAILS_SAVE_SECONDS = 2.0
+
+
+# Fungsi untuk menghitung jumlah halaman dokumen (hanya format dengan page_counter, misalnya PDF)
+def count_pages(filepath):
+    page_counter = get_format(os.path.splitext(filepath)[1])["page_counter"]
+    if page_counter is None:
+        return None
+    return resolve_backend(page_counter)(filepath)
+
+
+# Manifest metadata dokumen: nama, format, ukuran, mtime, halaman, jumlah karakter, dan hash
+class Manifest:
+    def __init__(self, folder=DOCUMENTS_FOLDER, path=MANIFEST_PATH):
+        self.folder = os.path.abspath(folder)
+        self.path = path
+        self.entries = {}
+        self.names = []  # Nama dokumen terurut; hanya diurutkan ulang oleh _scan saat ada perubahan
+        self.folder_mtime = None
+        self.scanned_at = 0.0
+        self.revision = 0  # Naik setiap kali daftar/isi dokumen berubah (dipakai indeks pencarian)
+        self._lock = threading.Lock()
+        self._details_thread = None
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return
+        if state.get("folder") == self.folder:
+            self.entries = state["entries"]
+            for entry in self.entries.values():
+                if "chars" not in entry:
+                    entry.update(chars=None, hash=None)  # Manifest lama tanpa jumlah karakter: isi ulang detailnya
+            self.names = sorted(self.entries)
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"folder": self.folder, "entries": self.entries}, file)
+        os.replace(temp_path, self.path)
+
+    # Perbarui manifest memakai data stat dari os.scandir; hanya file baru/berubah yang dihitung ulang
+    # Detail yang mahal (hash, halaman, karakter) diisi thread latar belakang, sehingga pemanggil (halaman Streamlit)
+    # tidak pernah menunggu file dibaca; selama belum terisi nilainya None
+    def refresh(self, force=False):
+        with self._lock:
+            try:
+                folder_mtime = os.stat(self.folder).st_mtime_ns
+            except OSError:
+                folder_mtime = None
+            fresh = time.monotonic() - self.scanned_at < RESCAN_SECONDS
+            needs_scan = force or not fresh or folder_mtime != self.folder_mtime
+
+            changed = False
+            if needs_scan:
+                changed = self._scan(folder_mtime)
+                if changed:
+                    self.revision += 1
+                    self._save()
+            pending = any(entry["hash"] is None for entry in self.entries.values())
+            if pending and (self._details_thread is None or not self._details_thread.is_alive()):
+                self._details_thread = threading.Thread(target=self._fill_details, daemon=True)
+                self._details_thread.start()
+            return changed
+
+    def _scan(self, folder_mtime):
+        changed = False
+        seen = set()
+        if folder_mtime is not None:
+            extensions = document_extensions()
+            with os.scandir(self.folder) as scanner:
+                for entry in scanner:
+                    if not entry.name.endswith(extensions) or not entry.is_file():
+                        continue
+                    seen.add(entry.name)
+                    stat = entry.stat()
+                    current = self.entries.get(entry.name)
+                    if current and current["size"] == stat.st_size and current["mtime"] == stat.st_mtime_ns:
+                        continue
+                    self.entries[entry.name] = {
+                        "name": entry.name,
+                        "format": os.path.splitext(entry.name)[1][1:].lower(),
+                        "size": stat.st_size,
+                        "mtime": stat.st_mtime_ns,
+                        "pages": None,
+                        "chars": None,
+                        "hash": None,
+                    }
+                    changed = True
+        for name in list(self.entries):
+            if name not in seen:
+                del self.entries[name]
+                changed = True
+        if changed:
+            self.names = sorted(self.entries)  # Daftar baru, bukan diubah di tempat (lihat list_documents)
+
+        self.folder_mtime = folder_mtime
+        self.scanned_at = time.monotonic()
+        return changed
+
+    # Dijalankan di thread latar belakang: file dibaca tanpa memegang lock, lalu hasilnya dicatat
+    # hanya jika file tidak berubah sementara itu
+    # Teks dibaca lewat read_file, jadi cache teks PDF/DOCX sudah terisi sebelum dokumen dibuka atau diringkas
+    def _fill_details(self):
+        saved_at = time.monotonic()
+        while True:
+            with self._lock:
+                entry = next((dict(entry) for entry in self.entries.values() if entry["hash"] is None), None)
+                if entry is None:
+                    self._save()
+                    return
+            filepath = os.path.join(self.folder, entry["name"])
+            try:
+                file_hash = hash_file(filepath)
+                pages = count_pages(filepath)
+                chars = len(read_file(filepath))
+            except Exception:
+                file_hash, pages, chars = "", None, None  # File rusak: jangan dicoba terus-menerus
+            with self._lock:
+                current = self.entries.get(entry["name"])
+                if current is not None and current["size"] == entry["size"] and current["mtime"] == entry["mtime"]:
+                    current["hash"] = file_hash
+                    current["pages"] = pages
+                    current["chars"] = chars
+                if time.monotonic() - saved_at > DETAILS_SAVE_SECONDS:
+                    self._save()
+                    saved_at = time.monotonic()
+
+    # Daftar dokumen terurut nama, dengan filter nama/format dan paginasi
+    # Memakai daftar nama yang sudah terurut, jadi tidak ada pengurutan per panggilan
+    # Mengembalikan (entri di halaman ini, jumlah total yang cocok)
+    def list_documents(self, name_filter="", formats=None, offset=0, limit=None):
+        name_filter = name_filter.lower()
+        with self._lock:
+            names = self.names
+            if name_filter or formats:
+                names = [
+                    name for name in names
+                    if (not name_filter or name_filter in name.lower())
+                    and (not formats or self.entries[name]["format"] in formats)
+                ]
+            end = None if limit is None else offset + limit
+            return [self.entries[name] for name in names[offset:end]], len(names)
+
+    # Sidik setiap dokumen {nama: (ukuran, mtime)}, dipakai model korpus untuk mengenali file yang berubah
+    def fingerprints(self):
+        with self._lock:
+            return {name: (entry["size"], entry["mtime"]) for name, entry in self.entries.items()}
+
+    def get(self, name):
+        with self._lock:
+            entry = self.entries.get(name)
+            return dict(entry) if entry else None
+
+
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+
+# Fungsi untuk mengambil manifest folder yang sudah diperbarui
+def get_manifest(folder=DOCUMENTS_FOLDER, path=MANIFEST_PATH):
+    with _manifests_lock:
+        manifest = _manifests.get(folder)
+        if manifest is None:
+            manifest = Manifest(folder, path)
+            _manifests[folder] = manifest
+    manifest.refresh()
+    return manifest
@@ -0,0 +1,113 @@
+import numpy as np
+from scipy import sparse
+
+from engines import DEFAULT_ENGINE, get_engine
+from instrumentation import stage
+from segmenter import sentence_spans
+from summarizer import (
+    DEFAULT_DIVERSITY,
+    DEFAULT_SUMMARY_LENGTH,
+    DEFAULT_VECTORIZER,
+    local_tf_idf_matrix,
+    mmr_pool_size,
+    resolve_summary_length,
+    select_sentences,
+    top_k_indices,
+)
+
+# Kalimat dengan kemiripan kosinus di atas batas ini dianggap duplikat (misalnya paragraf yang disalin antar laporan)
+DUPLICATE_THRESHOLD = 0.8
+
+
+# Fungsi untuk menormalkan kalimat sebelum dibandingkan sebagai duplikat persis
+def normalize_sentence(sentence):
+    return " ".join(sentence.lower().split())
+
+
+# Fungsi untuk membuang kandidat yang hampir sama dengan kandidat berskor lebih tinggi
+# Setiap kandidat yang dipertahankan dibandingkan dengan semua kandidat lewat satu perkalian sparse,
+# jadi tidak ada matriks kandidat x kandidat (lihat summarizer.mmr_select)
+def drop_near_duplicates(tf_idf_matrix, candidates, threshold=DUPLICATE_THRESHOLD):
+    candidate_matrix = sparse.csr_matrix(tf_idf_matrix[candidates])
+    feature_matrix = candidate_matrix.T.tocsr()
+    max_similarity = np.zeros(len(candidates))
+    kept = []
+    for position in range(len(candidates)):
+        if max_similarity[position] >= threshold:
+            continue
+        kept.append(position)
+        row = slice(candidate_matrix.indptr[position], candidate_matrix.indptr[position + 1])
+        similarity = feature_matrix[candidate_matrix.indices[row]].T @ candidate_matrix.data[row]
+        np.maximum(max_similarity, similarity, out=max_similarity)
+    return candidates[kept]
+
+
+# Ringkasan gabungan dari beberapa dokumen dengan satu matriks kalimat bersama (satu kali vektorisasi, IDF bersama)
+# `documents` berisi pasangan (nama, teks); kalimat yang sama persis hanya dihitung sekali
+# Mengembalikan daftar kalimat terpilih dalam urutan dokumen lalu offset:
+# [{"document", "start", "end", "text", "score", "also_in": [nama dokumen lain yang memuat kalimat yang sama]}]
+def summarize_documents(documents, corpus_model=None, length=DEFAULT_SUMMARY_LENGTH, engine=DEFAULT_ENGINE,
+                        diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER, stemming=False,
+                        duplicate_threshold=DUPLICATE_THRESHOLD):
+    score_sentences = get_engine(engine)
+    with stage("segment", documents=len(documents)):
+        sources = []  # Per kalimat unik: (nama dokumen, start, end)
+        sentences = []
+        also_in = []
+        first_seen = {}
+        blocks = []  # Rentang indeks kalimat milik setiap dokumen
+        for name, text in documents:
+            block_start = len(sentences)
+            for start, end in sentence_spans(text):
+                sentence = text[start:end]
+                key = normalize_sentence(sentence)
+                index = first_seen.get(key)
+                if index is not None:
+                    if name != sources[index][0] and name not in also_in[index]:
+                        also_in[index].append(name)
+                    continue
+                first_seen[key] = len(sentences)
+                sources.append((name, start, end))
+                sentences.append(sentence)
+                also_in.append([])
+            if len(sentences) > block_start:
+                blocks.append((block_start, len(sentences)))
+    if not sentences:
+        return []
+
+    with stage("vectorize", sentences=len(sentences)):
+        tf_idf_matrix = None
+        if corpus_model is not None and not stemming:
+            tf_idf_matrix = corpus_model.transform(sentences)
+            if tf_idf_matrix.nnz == 0:
+                tf_idf_matrix = None
+        if tf_idf_matrix is None:
+            tf_idf_matrix = local_tf_idf_matrix(sentences, vectorizer, stemming)
+
+    with stage("rank", engine=engine):
+        # Skor dihitung per dokumen (graf TextRank hanya sebesar satu dokumen, bukan seluruh gabungan),
+        # lalu dinormalkan ke rata-rata 1 agar skor antar dokumen sebanding
+        scores = np.zeros(len(sentences))
+        for start, end in blocks:
+            block_scores = np.asarray(score_sentences(tf_idf_matrix[start:end]), dtype=np.float64)
+            mean = block_scores.mean()
+            scores[start:end] = block_scores / mean if mean > 0 else block_scores
+        count = resolve_summary_length(length, len(sentences))
+        candidates = top_k_indices(scores, mmr_pool_size(count, len(scores)))
+        candidates = drop_near_duplicates(tf_idf_matrix, candidates, duplicate_threshold)
+        chosen = select_sentences(tf_idf_matrix[candidates], scores[candidates], count, diversity)
+        # Indeks global mengikuti urutan dokumen masukan lalu urutan kalimat di dalamnya
+        chosen = np.sort(candidates[chosen])
+
+    results = []
+    for index in chosen.tolist():
+        name, start, end = sources[index]
+        results.append({
+            "document": name,
+            "start": start,
+            "end": end,
+            "text": sentences[index],
+            "score": float(scores[index]),
+            "also_in": also_in[index],
+        })
+    return results
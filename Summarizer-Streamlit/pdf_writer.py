@@ -0,0 +1,170 @@
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+# reportlab baru di-import saat PDF pertama ditulis (lihat documents.py)
+
+# Ukuran halaman A4 dalam point, margin, dan pengaturan huruf
+PAGE_SIZE = (595.2756, 841.8898)
+PAGE_MARGIN = 72
+FONT_NAME = "Helvetica"
+FONT_SIZE = 11
+LINE_LEADING = 15  # Jarak antar baris
+
+# Lebar tab dalam spasi
+TAB_SIZE = 4
+
+# Batas jumlah kata yang lebarnya disimpan per font (kosakata dokumen biasanya jauh lebih kecil)
+WIDTH_CACHE_SIZE = 200000
+
+
+# Jumlah penulisan PDF yang sedang mematikan ASCII85 dan nilai rl_config.useA85 sebelum yang pertama dimulai
+_a85_lock = threading.Lock()
+_a85_writers = 0
+_a85_saved = None
+
+
+# Matikan encoding ASCII85 reportlab selama blok berjalan. Pengaturan ini global di proses, jadi penulis
+# yang berjalan bersamaan dihitung: yang pertama menyimpan nilai lama, yang terakhir memasangnya kembali
+@contextmanager
+def without_a85():
+    global _a85_writers, _a85_saved
+    from reportlab import rl_config
+
+    with _a85_lock:
+        if _a85_writers == 0:
+            _a85_saved = rl_config.useA85
+            rl_config.useA85 = 0
+        _a85_writers += 1
+    try:
+        yield
+    finally:
+        with _a85_lock:
+            _a85_writers -= 1
+            if _a85_writers == 0:
+                rl_config.useA85 = _a85_saved
+
+
+# Metrik lebar teks untuk satu font dan ukuran; lebar setiap kata disimpan agar tidak dihitung ulang
+# Satu objek dipakai ulang untuk semua dokumen yang ditulis dengan font yang sama (lihat get_font_metrics)
+class FontMetrics:
+    def __init__(self, font_name=FONT_NAME, font_size=FONT_SIZE):
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        self.font_name = font_name
+        self.font_size = font_size
+        self._string_width = stringWidth
+        self._widths = {}
+        self.space_width = self.width(" ")
+
+    # Fungsi untuk menghitung lebar teks dalam point
+    def width(self, text):
+        width = self._widths.get(text)
+        if width is None:
+            width = self._string_width(text, self.font_name, self.font_size)
+            if len(self._widths) < WIDTH_CACHE_SIZE:
+                self._widths[text] = width
+        return width
+
+
+# Fungsi untuk mengambil metrik font yang sudah pernah dibuat
+@lru_cache(maxsize=None)
+def get_font_metrics(font_name=FONT_NAME, font_size=FONT_SIZE):
+    return FontMetrics(font_name, font_size)
+
+
+# Fungsi untuk memecah aliran potongan teks menjadi baris, termasuk baris yang terpotong di antara dua potongan
+def iter_lines(chunks):
+    rest = ""
+    for chunk in chunks:
+        lines = (rest + chunk).split("\n")
+        rest = lines.pop()
+        yield from lines
+    yield rest
+
+
+# Fungsi untuk memotong kata yang lebih lebar dari satu baris per karakter
+def split_long_word(word, metrics, max_width):
+    pieces = []
+    piece_start = 0
+    piece_width = 0
+    for position, character in enumerate(word):
+        character_width = metrics.width(character)
+        if piece_width + character_width > max_width and position > piece_start:
+            pieces.append(word[piece_start:position])
+            piece_start = position
+            piece_width = 0
+        piece_width += character_width
+    pieces.append(word[piece_start:])
+    return pieces
+
+
+# Fungsi untuk membungkus satu baris teks agar muat dalam `max_width` (greedy, per kata)
+# Baris kosong dipertahankan sebagai pemisah paragraf
+def wrap_line(line, metrics, max_width):
+    words = line.expandtabs(TAB_SIZE).split()
+    if not words:
+        return [""]
+    wrapped = []
+    current = []
+    current_width = 0
+    for word in words:
+        word_width = metrics.width(word)
+        if word_width > max_width:
+            if current:
+                wrapped.append(" ".join(current))
+            *full_pieces, word = split_long_word(word, metrics, max_width)
+            wrapped.extend(full_pieces)
+            current = []
+            current_width = 0
+            word_width = metrics.width(word)
+        if current and current_width + metrics.space_width + word_width > max_width:
+            wrapped.append(" ".join(current))
+            current = []
+            current_width = 0
+        if current:
+            current_width += metrics.space_width
+        current.append(word)
+        current_width += word_width
+    if current:
+        wrapped.append(" ".join(current))
+    return wrapped
+
+
+# Fungsi untuk menulis teks ke PDF dalam satu lintasan: baris dibungkus, lalu dimasukkan ke satu text object
+# per halaman (bukan satu drawString per baris); halaman ditutup begitu penuh sehingga hanya satu halaman
+# yang menunggu di memori. `content` boleh berupa string atau iterable potongan teks (misalnya iter_txt_chunks)
+# Mengembalikan jumlah halaman
+def write_text_pdf(filepath, content, font_name=FONT_NAME, font_size=FONT_SIZE, leading=LINE_LEADING,
+                   page_size=PAGE_SIZE, margin=PAGE_MARGIN):
+    from reportlab.pdfgen import canvas
+
+    # Stream halaman cukup dikompresi zlib; encoding ASCII85 tambahan (tanpa akselerator C reportlab)
+    # memakan hampir separuh waktu tulis dan membuat file sekitar 20% lebih besar
+    with without_a85():
+        metrics = get_font_metrics(font_name, font_size)
+        page_width, page_height = page_size
+        max_width = page_width - 2 * margin
+        lines_per_page = max(1, int((page_height - 2 * margin) // leading))
+        top = page_height - margin - font_size
+
+        pdf = canvas.Canvas(filepath, pagesize=page_size)
+        chunks = [content] if isinstance(content, str) else content
+        text = None
+        lines_on_page = 0
+        pages = 0
+        for line in iter_lines(chunks):
+            for wrapped in wrap_line(line.rstrip("\r"), metrics, max_width):
+                if text is None or lines_on_page == lines_per_page:
+                    if text is not None:
+                        pdf.drawText(text)
+                        pdf.showPage()
+                    text = pdf.beginText(margin, top)
+                    text.setFont(font_name, font_size, leading)
+                    lines_on_page = 0
+                    pages += 1
+                text.textLine(wrapped)
+                lines_on_page += 1
+        if text is not None:
+            pdf.drawText(text)
+        pdf.save()
+    return max(pages, 1)
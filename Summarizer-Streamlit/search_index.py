@@ -0,0 +1,316 @@
+import json
+import math
+import os
+import pickle
+import re
+import shutil
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+from documents import DOCUMENTS_FOLDER, iter_txt_chunks, load_document_files, read_file
+from summarizer import STOP_WORDS_ID, TOKEN_PATTERN
+
+# Folder indeks terbalik yang disimpan di disk
+INDEX_FOLDER = os.path.join(".cache", "search_index")
+
+# Parameter BM25
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Segmen digabung menjadi satu jika jumlahnya melebihi batas ini
+MAX_SEGMENTS = 8
+
+# Lebar cuplikan di sekitar kemunculan pertama kata kueri
+SNIPPET_BEFORE = 60
+SNIPPET_AFTER = 160
+
+# Jumlah cuplikan yang disimpan (halaman menampilkan ulang cuplikan yang sama di setiap rerun)
+SNIPPET_CACHE_SIZE = 256
+
+TOKEN_REGEX = re.compile(TOKEN_PATTERN)
+STOP_WORDS = frozenset(STOP_WORDS_ID)
+
+
+# Fungsi untuk memecah teks menjadi (term, offset) dengan pola token dan stop words yang sama seperti summarizer
+def iter_tokens(text):
+    for match in TOKEN_REGEX.finditer(text):
+        term = match.group().lower()
+        if term not in STOP_WORDS:
+            yield term, match.start()
+
+
+# Fungsi untuk membaca teks [start, end) sebuah dokumen untuk cuplikan
+# File .txt dibaca per potongan dan berhenti setelah `end`; PDF/DOCX diambil dari cache teks
+@lru_cache(maxsize=SNIPPET_CACHE_SIZE)
+def read_snippet(filepath, fingerprint, start, end):
+    if not filepath.endswith(".txt"):
+        return read_file(filepath)[start:end]
+    pieces = []
+    position = 0
+    for chunk in iter_txt_chunks(filepath):
+        if position + len(chunk) > start:
+            pieces.append(chunk[max(0, start - position):max(0, end - position)])
+        position += len(chunk)
+        if position >= end:
+            break
+    return "".join(pieces)
+
+
+# Satu segmen indeks: kamus term di memori, postings di file .npy yang di-memory-map
+class Segment:
+    def __init__(self, folder):
+        self.folder = folder
+        with open(os.path.join(folder, "terms.pkl"), "rb") as file:
+            self.terms = pickle.load(file)  # term -> (awal, akhir) di array postings
+        self.doc_ids = np.load(os.path.join(folder, "doc_ids.npy"), mmap_mode="r")
+        self.term_freqs = np.load(os.path.join(folder, "term_freqs.npy"), mmap_mode="r")
+        self.offsets = np.load(os.path.join(folder, "offsets.npy"), mmap_mode="r")
+
+    def postings(self, term):
+        bounds = self.terms.get(term)
+        if bounds is None:
+            return None
+        start, end = bounds
+        return self.doc_ids[start:end], self.term_freqs[start:end], self.offsets[start:end]
+
+    # Fungsi untuk menulis segmen baru dari postings {term: [(doc_id, tf, offset), ...]}
+    @staticmethod
+    def write(folder, postings):
+        os.makedirs(folder, exist_ok=True)
+        terms = {}
+        doc_ids, term_freqs, offsets = [], [], []
+        position = 0
+        for term in sorted(postings):
+            entries = sorted(postings[term])
+            terms[term] = (position, position + len(entries))
+            position += len(entries)
+            for doc_id, term_freq, offset in entries:
+                doc_ids.append(doc_id)
+                term_freqs.append(term_freq)
+                offsets.append(offset)
+        np.save(os.path.join(folder, "doc_ids.npy"), np.array(doc_ids, dtype=np.uint32))
+        np.save(os.path.join(folder, "term_freqs.npy"), np.array(term_freqs, dtype=np.uint32))
+        np.save(os.path.join(folder, "offsets.npy"), np.array(offsets, dtype=np.uint32))
+        with open(os.path.join(folder, "terms.pkl"), "wb") as file:
+            pickle.dump(terms, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# Indeks terbalik BM25 yang diperbarui secara bertahap (segmen baru + tanda hapus)
+class SearchIndex:
+    def __init__(self, folder=DOCUMENTS_FOLDER, index_folder=INDEX_FOLDER):
+        self.folder = os.path.abspath(folder)
+        self.index_folder = index_folder
+        # doc_id -> {"name", "length", "fingerprint", "live"}
+        self.documents = []
+        self.segment_names = []
+        self.segments = []
+        self.next_segment = 0
+        self.synced_revision = None  # Revisi manifest terakhir yang sudah disinkronkan (lihat sync)
+        # Salinan numpy dari self.documents untuk pencarian; dibuat ulang oleh _refresh_arrays setiap ada perubahan
+        self.names = []
+        self.live = np.zeros(0, dtype=bool)
+        self.lengths = np.zeros(0, dtype=np.float64)
+        self._lock = threading.Lock()
+        self._load()
+        self._refresh_arrays()
+
+    def _meta_path(self):
+        return os.path.join(self.index_folder, "meta.json")
+
+    def _load(self):
+        try:
+            with open(self._meta_path(), "r", encoding="utf-8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return
+        if meta.get("folder") != self.folder:
+            return  # Indeks milik folder lain, bangun ulang untuk folder ini
+        try:
+            segments = [Segment(os.path.join(self.index_folder, name)) for name in meta["segments"]]
+        except (OSError, ValueError, pickle.UnpicklingError):
+            return
+        self.documents = meta["documents"]
+        self.segment_names = meta["segments"]
+        self.segments = segments
+        self.next_segment = meta["next_segment"]
+
+    def _save_meta(self):
+        os.makedirs(self.index_folder, exist_ok=True)
+        meta = {
+            "folder": self.folder,
+            "documents": self.documents,
+            "segments": self.segment_names,
+            "next_segment": self.next_segment,
+        }
+        temp_path = f"{self._meta_path()}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        os.replace(temp_path, self._meta_path())
+
+    # Bangun ulang nama, tanda hidup, dan panjang dokumen sebagai objek baru, sehingga pencarian yang sedang
+    # berjalan tetap memakai salinan lamanya yang utuh
+    def _refresh_arrays(self):
+        self.names = [document["name"] for document in self.documents]
+        self.live = np.array([document["live"] for document in self.documents], dtype=bool)
+        self.lengths = np.array([document["length"] for document in self.documents], dtype=np.float64)
+
+    def _new_segment_name(self):
+        name = f"segment_{self.next_segment:06d}"
+        self.next_segment += 1
+        return name
+
+    # Sinkronkan indeks dengan folder: dokumen baru/berubah masuk ke segmen baru, yang lama ditandai terhapus
+    def update(self):
+        with self._lock:
+            current = {}
+            for filename in load_document_files(self.folder):
+                stat = os.stat(os.path.join(self.folder, filename))
+                current[filename] = [stat.st_size, stat.st_mtime_ns]
+
+            indexed = {}
+            changed = False
+            for doc_id, document in enumerate(self.documents):
+                if not document["live"]:
+                    continue
+                if current.get(document["name"]) == document["fingerprint"]:
+                    indexed[document["name"]] = doc_id
+                else:
+                    document["live"] = False
+                    changed = True
+
+            postings = defaultdict(list)
+            for name, fingerprint in current.items():
+                if name in indexed:
+                    continue
+                try:
+                    text = read_file(os.path.join(self.folder, name))
+                except Exception:
+                    continue  # File rusak dilewati, dicoba lagi saat berubah
+                doc_id = len(self.documents)
+                term_freqs = {}
+                first_offsets = {}
+                length = 0
+                for term, offset in iter_tokens(text):
+                    length += 1
+                    term_freqs[term] = term_freqs.get(term, 0) + 1
+                    first_offsets.setdefault(term, offset)
+                for term, term_freq in term_freqs.items():
+                    postings[term].append((doc_id, term_freq, first_offsets[term]))
+                self.documents.append({"name": name, "length": length, "fingerprint": fingerprint, "live": True})
+                changed = True
+
+            if postings:
+                name = self._new_segment_name()
+                Segment.write(os.path.join(self.index_folder, name), postings)
+                self.segment_names.append(name)
+                self.segments.append(Segment(os.path.join(self.index_folder, name)))
+            if changed:
+                self._refresh_arrays()
+            if len(self.segments) > MAX_SEGMENTS:
+                self._merge_segments()
+            elif changed:
+                self._save_meta()
+            return changed
+
+    # Sinkronkan hanya jika manifest folder berubah sejak sinkronisasi terakhir (bukan di setiap pencarian)
+    def sync(self, revision):
+        if revision != self.synced_revision:
+            self.update()
+            self.synced_revision = revision
+
+    # Fungsi untuk mengambil teks cuplikan hasil pencarian tanpa membaca seluruh file .txt
+    def snippet(self, name, start, end):
+        filepath = os.path.join(self.folder, name)
+        return read_snippet(filepath, os.stat(filepath).st_mtime_ns, start, end)
+
+    # Gabungkan semua segmen menjadi satu, sambil membuang dokumen yang terhapus beserta postings-nya
+    # Dokumen yang tersisa diberi doc_id baru yang rapat, jadi daftar dokumen tidak tumbuh terus
+    def _merge_segments(self):
+        live = self.live
+        new_ids = np.cumsum(live) - 1  # doc_id lama -> doc_id baru (hanya berlaku untuk dokumen hidup)
+        postings = defaultdict(list)
+        for segment in self.segments:
+            for term in segment.terms:
+                doc_ids, term_freqs, offsets = segment.postings(term)
+                keep = live[doc_ids]
+                postings[term].extend(zip(
+                    new_ids[doc_ids[keep]].tolist(), term_freqs[keep].tolist(), offsets[keep].tolist()
+                ))
+        old_names = self.segment_names
+        name = self._new_segment_name()
+        Segment.write(os.path.join(self.index_folder, name), postings)
+        self.segment_names = [name]
+        self.segments = [Segment(os.path.join(self.index_folder, name))]
+        self.documents = [document for document in self.documents if document["live"]]
+        self._refresh_arrays()
+        self._save_meta()
+        for old_name in old_names:
+            shutil.rmtree(os.path.join(self.index_folder, old_name), ignore_errors=True)
+
+    # Cari dokumen dengan BM25; hasil: [{"name", "score", "snippet": (start, end)}]
+    def search(self, query, limit=10):
+        terms = list(dict.fromkeys(term for term, _ in iter_tokens(query)))
+        with self._lock:
+            names, live, lengths = self.names, self.live, self.lengths
+            segments = list(self.segments)
+        if not terms or not names:
+            return []
+
+        live_count = int(live.sum())
+        if live_count == 0:
+            return []
+        average_length = lengths[live].mean() or 1.0
+        scores = np.zeros(len(names))
+        # Offset kemunculan pertama kata kueri per dokumen, untuk cuplikan
+        first_offsets = np.full(len(names), np.iinfo(np.uint32).max, dtype=np.uint64)
+
+        for term in terms:
+            matches = []
+            for segment in segments:
+                found = segment.postings(term)
+                if found is None:
+                    continue
+                doc_ids, term_freqs, offsets = found
+                keep = live[doc_ids]
+                if keep.any():
+                    matches.append((doc_ids[keep], term_freqs[keep], offsets[keep]))
+            document_frequency = sum(len(doc_ids) for doc_ids, _, _ in matches)
+            if document_frequency == 0:
+                continue
+            idf = math.log(1 + (live_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            for doc_ids, term_freqs, offsets in matches:
+                term_freqs = term_freqs.astype(np.float64)
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_ids] / average_length)
+                scores[doc_ids] += idf * term_freqs * (BM25_K1 + 1) / (term_freqs + norm)
+                first_offsets[doc_ids] = np.minimum(first_offsets[doc_ids], offsets)
+
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+        matched = matched[np.argsort(-scores[matched], kind="stable")]
+        results = []
+        for doc_id in matched.tolist():
+            offset = int(first_offsets[doc_id])
+            results.append({
+                "name": names[doc_id],
+                "score": float(scores[doc_id]),
+                "snippet": (max(0, offset - SNIPPET_BEFORE), offset + SNIPPET_AFTER),
+            })
+        return results
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+# Fungsi untuk mengambil indeks pencarian folder; pemanggil memperbaruinya dengan update() atau sync()
+def get_search_index(folder=DOCUMENTS_FOLDER, index_folder=INDEX_FOLDER):
+    with _indexes_lock:
+        index = _indexes.get(folder)
+        if index is None:
+            index = SearchIndex(folder, index_folder)
+            _indexes[folder] = index
+    return index
@@ -0,0 +1,93 @@
+import re
+
+# Singkatan Bahasa Indonesia yang diakhiri titik tetapi bukan akhir kalimat
+ABBREVIATIONS_ID = {
+    "dll", "dsb", "dst", "dkk", "dgn", "yg", "tsb", "spt", "sbb", "krn", "utk", "dlm",
+    "no", "hlm", "tgl", "thn", "jln", "jl", "gg", "rt", "rw", "kel", "kec", "kab", "prov",
+    "yth", "sdr", "sdri", "bpk", "dr", "drs", "dra", "ir", "prof", "hj", "pt", "cv", "tbk",
+    "ttd", "lamp", "ket", "vol", "cet", "terj", "s.h", "s.e", "s.pd", "s.kom", "s.t",
+    "m.m", "m.si", "m.pd", "a.n", "u.p",
+}
+
+# Singkatan yang sering juga menutup kalimat; dianggap akhir kalimat jika diikuti huruf kapital
+SENTENCE_FINAL_ABBREVIATIONS = {"dll", "dsb", "dst", "dkk"}
+
+# Kandidat batas kalimat: tanda akhir (diikuti kutip/kurung penutup) sebelum spasi atau akhir teks, atau baris baru
+BOUNDARY_PATTERN = re.compile(r"([.!?]+)[\"'”’)\]]*(?=\s|$)|\n")
+
+# Kata (boleh mengandung titik, misalnya "s.pd") tepat sebelum sebuah titik
+WORD_BEFORE_PATTERN = re.compile(r"(\w+(?:\.\w+)*)$")
+
+# Panjang teks yang diperiksa ke belakang untuk mencari kata sebelum titik
+LOOKBEHIND_CHARS = 32
+
+
+# Huruf pertama setelah spasi, untuk melihat apakah kalimat baru dimulai
+NEXT_WORD_PATTERN = re.compile(r"\s*(\S)")
+
+
+# Fungsi untuk mengecek apakah titik di posisi `position` adalah bagian dari singkatan
+def is_abbreviation(text, position, next_position):
+    match = WORD_BEFORE_PATTERN.search(text, max(0, position - LOOKBEHIND_CHARS), position)
+    if match is None:
+        return False
+    word = match.group(1).lower()
+    if word in SENTENCE_FINAL_ABBREVIATIONS:
+        following = NEXT_WORD_PATTERN.match(text, next_position)
+        return following is None or not following.group(1).isupper()
+    # Satu huruf (inisial nama, mis. "A. Rahman") juga dianggap singkatan
+    return word in ABBREVIATIONS_ID or (len(word) == 1 and word.isalpha())
+
+
+# Fungsi untuk memangkas spasi di awal/akhir span tanpa menyalin teks
+def trim_span(text, start, end):
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+# Fungsi untuk memecah teks menjadi kalimat dalam bentuk offset (start, end)
+def sentence_spans(text, start=0, end=None):
+    end = len(text) if end is None else end
+    spans = []
+    sentence_start = start
+    for match in BOUNDARY_PATTERN.finditer(text, start, end):
+        if match.group(1) == "." and is_abbreviation(text, match.start(), match.end()):
+            continue
+        span = trim_span(text, sentence_start, match.end())
+        if span[0] < span[1]:
+            spans.append(span)
+        sentence_start = match.end()
+    span = trim_span(text, sentence_start, end)
+    if span[0] < span[1]:
+        spans.append(span)
+    return spans
+
+
+# Fungsi untuk memecah aliran potongan teks menjadi kalimat saat teks tiba: (start, end, teks kalimat)
+# Offset dihitung terhadap gabungan seluruh potongan; hanya kalimat terakhir yang disimpan di buffer
+def iter_sentences(chunks):
+    buffer = ""
+    offset = 0
+    for chunk in chunks:
+        buffer += chunk
+        spans = sentence_spans(buffer)
+        if len(spans) < 2:
+            continue
+        # Kalimat terakhir mungkin berlanjut di potongan berikutnya, jadi tetap di buffer
+        for start, end in spans[:-1]:
+            yield offset + start, offset + end, buffer[start:end]
+        keep_from = spans[-1][0]
+        buffer = buffer[keep_from:]
+        offset += keep_from
+    for start, end in sentence_spans(buffer):
+        yield offset + start, offset + end, buffer[start:end]
+
+
+# Fungsi untuk memecah aliran potongan teks menjadi span kalimat saat teks tiba
+# Offset dihitung terhadap gabungan seluruh potongan
+def iter_sentence_spans(chunks):
+    for start, end, _ in iter_sentences(chunks):
+        yield start, end
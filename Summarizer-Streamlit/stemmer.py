@@ -0,0 +1,115 @@
+from functools import lru_cache
+
+# Panjang minimal kata dasar; aturan yang menyisakan kata lebih pendek tidak diterapkan
+MIN_STEM_LENGTH = 4
+
+# Jumlah kata yang disimpan di cache stemmer (sebagian besar token berulang, sesuai hukum Zipf)
+STEM_CACHE_SIZE = 65536
+
+PARTICLES = ("lah", "kah", "pun")
+POSSESSIVES = ("nya", "ku", "mu")
+DERIVATIONAL_SUFFIXES = ("kan", "an", "i")
+VOWELS = frozenset("aiueo")
+
+# Awalan tingkat pertama: (awalan, jenis); meN-/peN- bisa mengubah huruf awal kata dasar (lihat _recode)
+FIRST_ORDER_PREFIXES = (
+    ("meng", "me"), ("meny", "me"), ("men", "me"), ("mem", "me"), ("me", "me"),
+    ("peng", "pe"), ("peny", "pe"), ("pen", "pe"), ("pem", "pe"),
+    ("di", "di"), ("ter", "te"), ("ke", "ke"),
+)
+
+# Awalan tingkat kedua, dicoba setelah awalan tingkat pertama (misalnya mem-per-baiki)
+# "bel-"/"pel-" hanya dipakai untuk kata dasar "ajar" (belajar, pelajaran)
+SECOND_ORDER_PREFIXES = (("per", "pe"), ("ber", "be"), ("bel", "be"), ("pel", "pe"), ("pe", "pe"), ("be", "be"))
+
+# Pasangan awalan-akhiran yang tidak ada dalam Bahasa Indonesia (misalnya di-...-an, pe-...-kan)
+DISALLOWED_CONFIXES = frozenset([
+    ("be", "i"), ("di", "an"), ("ke", "i"), ("ke", "kan"), ("me", "an"), ("te", "an"), ("pe", "kan"),
+])
+
+
+# Fungsi untuk mengembalikan huruf awal kata dasar yang luluh karena meN-/peN- (menulis -> tulis)
+def _recode(prefix, rest):
+    if not rest:
+        return rest
+    if prefix in ("meny", "peny") and rest[0] in VOWELS:
+        return "s" + rest
+    if prefix in ("men", "pen") and rest[0] in VOWELS:
+        return "t" + rest
+    if prefix in ("mem", "pem") and rest[0] in VOWELS:
+        return "p" + rest
+    return rest
+
+
+def _strip_suffix(word, suffixes):
+    for suffix in suffixes:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+
+# Fungsi untuk mencari awalan yang bisa dilepas; mengembalikan (sisa kata, jenis awalan, huruf diubah) atau None
+def _strip_prefix(word, prefixes):
+    for prefix, kind in prefixes:
+        if not word.startswith(prefix):
+            continue
+        rest = word[len(prefix):]
+        # "me"/"pe" tanpa nasal hanya muncul sebelum l, m, n, r, w, y (melihat, merasa)
+        if prefix == "me" and (not rest or rest[0] not in "lmnrwy"):
+            continue
+        if prefix in ("bel", "pel") and not rest.startswith("ajar"):
+            continue
+        # "be-" tanpa r hanya muncul sebelum konsonan + "er" (bekerja); kata berawalan "ber" yang sisanya
+        # terlalu pendek adalah kata dasar (bersih, berkas), bukan be- + rsih
+        if prefix == "be" and (word.startswith("ber") or len(rest) < 3 or rest[0] in VOWELS or rest[1:3] != "er"):
+            continue
+        recoded = _recode(prefix, rest)
+        if len(recoded) >= MIN_STEM_LENGTH:
+            return recoded, kind, recoded != rest
+    return None
+
+
+# Stemmer berbasis aturan (tanpa kamus) untuk Bahasa Indonesia, mengikuti urutan algoritma Tala:
+# partikel -> kata ganti milik -> awalan tingkat pertama -> akhiran turunan -> awalan tingkat kedua
+# (tanpa awalan tingkat pertama: awalan tingkat kedua lalu akhiran turunan)
+# Tujuannya menyatukan bentuk kata (membaca, dibaca, bacaan -> baca), bukan menghasilkan kata dasar yang selalu tepat
+def stem_word(word):
+    if len(word) <= MIN_STEM_LENGTH or not word.isalpha():
+        return word
+    word = _strip_suffix(word, PARTICLES)
+    word = _strip_suffix(word, POSSESSIVES)
+
+    stripped = _strip_prefix(word, FIRST_ORDER_PREFIXES)
+    if stripped is not None:
+        word, kind, recoded = stripped
+        word = _strip_derivational_suffix(word, kind)
+        # Huruf yang dikembalikan bukan awalan baru (pemerintah -> perintah, bukan intah)
+        second = None if recoded else _strip_prefix(word, SECOND_ORDER_PREFIXES)
+        return word if second is None else second[0]
+
+    second = _strip_prefix(word, SECOND_ORDER_PREFIXES)
+    if second is not None:
+        word, kind, _ = second
+        return _strip_derivational_suffix(word, kind)
+    return _strip_derivational_suffix(word, None)
+
+
+# Fungsi untuk melepas akhiran turunan yang boleh dipasangkan dengan jenis awalan `kind`
+# Tanpa awalan, akhiran -i terlalu sering merupakan bagian kata dasar (teknologi, pagi)
+def _strip_derivational_suffix(word, kind):
+    allowed = [
+        suffix for suffix in DERIVATIONAL_SUFFIXES
+        if (kind, suffix) not in DISALLOWED_CONFIXES and (kind is not None or suffix != "i")
+    ]
+    return _strip_suffix(word, allowed)
+
+
+# Stemmer dengan memoization terbatas (LRU)
+cached_stem = lru_cache(maxsize=STEM_CACHE_SIZE)(stem_word)
+
+
+# Fungsi untuk membungkus analyzer scikit-learn agar setiap token (setelah stop words dibuang) di-stem
+def stemming_analyzer(analyzer, stem=cached_stem):
+    def analyze(document):
+        return [stem(token) for token in analyzer(document)]
+    return analyze
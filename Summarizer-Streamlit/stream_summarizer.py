@@ -0,0 +1,96 @@
+import heapq
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from documents import iter_txt_chunks
+from instrumentation import stage
+from segmenter import iter_sentences
+from summarizer import (
+    DEFAULT_DIVERSITY,
+    DEFAULT_SUMMARY_LENGTH,
+    HASHING_CHUNK_SENTENCES,
+    HASHING_FEATURES,
+    build_analyzer,
+    mmr_pool_size,
+    resolve_summary_length,
+    select_sentences,
+    top_k_indices,
+)
+
+# File .txt sebesar ini atau lebih diringkas secara streaming (lihat batch_summarize)
+LARGE_TEXT_BYTES = 64 * 1024 * 1024
+
+
+# Fungsi untuk mengelompokkan aliran kalimat menjadi batch berisi `size` kalimat
+def iter_batches(sentences, size):
+    batch = []
+    for sentence in sentences:
+        batch.append(sentence)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# Ringkasan file teks besar dengan memori terbatas, memakai engine TF-IDF dengan fitur hash:
+# tahap 1 menghitung document frequency per fitur, tahap 2 memberi skor kalimat dan hanya menyimpan
+# kandidat teratas. Teks utuh dan matriks seluruh kalimat tidak pernah disimpan di memori.
+# Hasilnya sama dengan rank_sentence_spans(teks, vectorizer="hashing") untuk engine "tfidf"
+# Mengembalikan [(start, end, teks kalimat)] dalam urutan dokumen
+def rank_large_text_file(filepath, length=DEFAULT_SUMMARY_LENGTH, diversity=DEFAULT_DIVERSITY, stemming=False,
+                         n_features=HASHING_FEATURES, batch_sentences=HASHING_CHUNK_SENTENCES):
+    vectorizer = HashingVectorizer(
+        n_features=n_features,
+        analyzer=build_analyzer(stemming),
+        alternate_sign=False,
+        norm=None,
+        dtype=np.float32,
+    )
+
+    with stage("vectorize", streaming=True):
+        document_frequency = np.zeros(n_features, dtype=np.int64)
+        sentence_count = 0
+        for batch in iter_batches(iter_sentences(iter_txt_chunks(filepath)), batch_sentences):
+            counts = vectorizer.transform([sentence for _, _, sentence in batch])
+            document_frequency += np.bincount(counts.indices, minlength=n_features)
+            sentence_count += len(batch)
+    if sentence_count == 0:
+        return []
+    idf = np.log((1 + sentence_count) / (1 + document_frequency)) + 1
+
+    count = resolve_summary_length(length, sentence_count)
+    pool_size = mmr_pool_size(count, sentence_count) if diversity > 0 else count
+    with stage("rank", engine="tfidf", streaming=True, sentences=sentence_count):
+        # Min-heap berisi (skor, -indeks, ...): skor terendah dibuang lebih dulu; untuk skor sama,
+        # kalimat yang lebih awal dipertahankan seperti pada pengurutan stabil
+        heap = []
+        index = 0
+        for batch in iter_batches(iter_sentences(iter_txt_chunks(filepath)), batch_sentences):
+            counts = vectorizer.transform([sentence for _, _, sentence in batch])
+            tf_idf_matrix = normalize(sparse.csr_matrix(counts.multiply(idf)), norm="l2")
+            scores = np.asarray(tf_idf_matrix.sum(axis=1)).ravel()
+            for position in top_k_indices(scores, min(len(scores), pool_size)).tolist():
+                start, end, sentence = batch[position]
+                item = (float(scores[position]), -(index + position), start, end, sentence,
+                        tf_idf_matrix[position])
+                if len(heap) < pool_size:
+                    heapq.heappush(heap, item)
+                elif item[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, item)
+            index += len(batch)
+
+        candidates = sorted(heap, key=lambda item: -item[1])  # Urutan dokumen
+        candidate_matrix = sparse.vstack([item[5] for item in candidates], format="csr")
+        candidate_scores = np.array([item[0] for item in candidates])
+        chosen = select_sentences(candidate_matrix, candidate_scores, count, diversity)
+    return [candidates[position][2:5] for position in chosen.tolist()]
+
+
+# Fungsi untuk menghitung ringkasan file teks besar sebagai teks
+def compute_large_text_summary(filepath, length=DEFAULT_SUMMARY_LENGTH, diversity=DEFAULT_DIVERSITY,
+                               stemming=False):
+    return ' '.join(sentence for _, _, sentence in rank_large_text_file(filepath, length, diversity, stemming))
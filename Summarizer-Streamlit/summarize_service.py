@@ -0,0 +1,318 @@
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+import documents
+from documents import DOCUMENTS_FOLDER, document_extensions, process_pool_context, read_file
+from engines import DEFAULT_ENGINE, SUMMARIZER_ENGINES
+from summarizer import DEFAULT_DIVERSITY, DEFAULT_SUMMARY_LENGTH, rank_sentence_spans
+from summary_cache import cached_rank_sentence_spans, summary_cache, summary_key
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+
+# Jumlah permintaan yang boleh menunggu di antrean di luar yang sedang dikerjakan
+DEFAULT_QUEUE_SIZE = 64
+
+# Batas ukuran body permintaan dan waktu tunggu hasil per permintaan
+MAX_BODY_BYTES = 20 * 1024 * 1024
+REQUEST_TIMEOUT = 60.0
+
+
+class BadRequest(Exception):
+    pass
+
+
+class PayloadTooLarge(Exception):
+    pass
+
+
+class Saturated(Exception):
+    pass
+
+
+# Model korpus (diperbarui terhadap isi folder) hanya jika diminta
+def _corpus_model(folder, use_corpus_idf):
+    if not use_corpus_idf:
+        return None
+    from corpus_model import get_corpus_model
+    return get_corpus_model(folder)
+
+
+# Initializer untuk setiap proses worker
+# Paralelisme sudah per permintaan, jadi ekstraksi PDF di dalam worker tetap serial
+def _init_worker():
+    documents.PDF_EXTRACTION_WORKERS = 1
+
+
+# Pekerjaan kosong untuk menyalakan proses worker sebelum permintaan pertama
+def warm_up_job():
+    return os.getpid()
+
+
+# Pekerjaan di proses worker: ringkas teks mentah, kembalikan span terpilih
+def summarize_text_job(text, options, folder):
+    _, spans = rank_sentence_spans(
+        text, _corpus_model(folder, options["corpus_idf"]), options["length"], options["engine"], options["diversity"]
+    )
+    return spans
+
+
+# Pekerjaan di proses worker: baca dokumen tersimpan (lewat cache teks) lalu ringkas (lewat cache ringkasan)
+def summarize_document_job(name, options, folder):
+    text = read_file(os.path.join(folder, name))
+    text, spans = cached_rank_sentence_spans(
+        text, _corpus_model(folder, options["corpus_idf"]), options["length"], options["engine"], options["diversity"]
+    )
+    return {"summary": " ".join(text[start:end] for start, end in spans), "sentences": spans}
+
+
+# Fungsi untuk membaca dan memvalidasi parameter ringkasan dari JSON permintaan
+def parse_options(payload):
+    engine = payload.get("engine", DEFAULT_ENGINE)
+    if not isinstance(engine, str) or engine not in SUMMARIZER_ENGINES:
+        raise BadRequest(f"Unknown engine {engine!r}.")
+    length = payload.get("length", DEFAULT_SUMMARY_LENGTH)
+    if not isinstance(length, (int, float)) or isinstance(length, bool) or length <= 0:
+        raise BadRequest("'length' must be a positive sentence count or a ratio between 0 and 1.")
+    diversity = payload.get("diversity", DEFAULT_DIVERSITY)
+    if not isinstance(diversity, (int, float)) or isinstance(diversity, bool) or not 0 <= diversity <= 1:
+        raise BadRequest("'diversity' must be between 0 and 1.")
+    return {
+        "engine": engine,
+        "length": length,
+        "diversity": float(diversity),
+        "corpus_idf": bool(payload.get("corpus_idf", False)),
+    }
+
+
+# Pool worker dengan antrean terbatas; permintaan ditolak (429) saat penuh
+# Batch yang lebih besar dari kapasitas (worker + antrean) tidak akan pernah muat, jadi ditolak sebagai 400
+class SummaryService:
+    def __init__(self, folder=DOCUMENTS_FOLDER, workers=None, queue_size=DEFAULT_QUEUE_SIZE):
+        self.folder = folder
+        self.workers = workers or os.cpu_count() or 1
+        self.capacity = self.workers + queue_size
+        # forkserver menghindari fork dari proses server yang sudah punya banyak thread
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=process_pool_context(), initializer=_init_worker
+        )
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        for future in [self._pool.submit(warm_up_job) for _ in range(self.workers)]:
+            future.result()
+
+    # Ambil sejumlah slot sekaligus, atau tolak tanpa menunggu
+    def _reserve(self, count):
+        taken = 0
+        while taken < count and self._slots.acquire(blocking=False):
+            taken += 1
+        if taken < count:
+            for _ in range(taken):
+                self._slots.release()
+            raise Saturated()
+
+    def _submit(self, function, *args):
+        future = self._pool.submit(function, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _text_job(self, text, options):
+        if not isinstance(text, str):
+            raise BadRequest("'text' must be a string.")
+        # Model korpus hanya disinkronkan saat revisi manifest berubah, jadi panggilan per permintaan murah
+        revision = _corpus_model(self.folder, True).revision if options["corpus_idf"] else None
+        key = summary_key(text, options["engine"], options["length"], revision, diversity=options["diversity"])
+        spans = summary_cache.get(key)
+        if spans is not None:
+            self._slots.release()  # Hit cache: slot tidak dipakai
+            return None, (text, key, spans)
+        return self._submit(summarize_text_job, text, options, self.folder), (text, key, None)
+
+    def _document_job(self, name, options):
+        valid_name = isinstance(name, str) and os.path.basename(name) == name
+        if not valid_name or not name.endswith(document_extensions()):
+            raise BadRequest("Invalid document name.")
+        if not os.path.isfile(os.path.join(self.folder, name)):
+            raise LookupError(f"Document '{name}' not found.")
+        return self._submit(summarize_document_job, name, options, self.folder), None
+
+    @staticmethod
+    def _finish(future, context):
+        if context is None:
+            return future.result(timeout=REQUEST_TIMEOUT)
+        text, key, spans = context
+        if future is not None:
+            spans = [tuple(span) for span in future.result(timeout=REQUEST_TIMEOUT)]
+            summary_cache.put(key, spans)
+        return {"summary": " ".join(text[start:end] for start, end in spans), "sentences": spans}
+
+    # Permintaan tunggal atau batch; setiap item berisi "text" atau "document"
+    # Dengan `item_errors`, kesalahan satu item dicatat sebagai {"error": ...} di hasilnya dan item lain tetap diringkas
+    def summarize(self, items, options, item_errors=False):
+        if len(items) > self.capacity:
+            raise BadRequest(f"A batch can hold at most {self.capacity} items.")
+        self._reserve(len(items))
+        jobs = []
+        try:
+            for item in items:
+                try:
+                    if not isinstance(item, dict):
+                        raise BadRequest("Each item must be an object with 'text' or 'document'.")
+                    if "document" in item:
+                        jobs.append(self._document_job(item["document"], options))
+                    else:
+                        jobs.append(self._text_job(item.get("text"), options))
+                except (BadRequest, LookupError) as error:
+                    if not item_errors:
+                        raise
+                    self._slots.release()  # Item tidak dikirim ke pool
+                    jobs.append((None, error))
+        except Exception:
+            # Kembalikan slot milik item yang belum sempat dikirim ke pool
+            for _ in range(len(items) - len(jobs)):
+                self._slots.release()
+            raise
+        results = []
+        for future, context in jobs:
+            if isinstance(context, Exception):
+                results.append({"error": str(context)})
+                continue
+            try:
+                results.append(self._finish(future, context))
+            except Exception as error:
+                if not item_errors or isinstance(error, FutureTimeout):
+                    raise
+                results.append({"error": f"{type(error).__name__}: {error}"})
+        return results
+
+    def shutdown(self):
+        self._pool.shutdown(cancel_futures=True)
+
+
+class SummaryRequestHandler(BaseHTTPRequestHandler):
+    service = None
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise BadRequest("Invalid Content-Length header.")
+        if length > MAX_BODY_BYTES:
+            raise PayloadTooLarge()
+        if not length:
+            return {}
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise BadRequest("Request body must be valid JSON.")
+        if not isinstance(payload, dict):
+            raise BadRequest("Request body must be a JSON object.")
+        return payload
+
+    def _handle(self, route):
+        try:
+            payload = self._read_json() if self.command == "POST" else {}
+            status, body = route(payload)
+            self._send_json(status, body)
+        except BadRequest as error:
+            self._send_json(400, {"error": str(error)})
+        except PayloadTooLarge:
+            self.close_connection = True  # Body tidak dibaca, jadi koneksi tidak bisa dipakai ulang
+            self._send_json(413, {"error": "Request body is too large."})
+        except LookupError as error:
+            self._send_json(404, {"error": str(error)})
+        except Saturated:
+            self._send_json(429, {"error": "Server is busy, retry later."}, {"Retry-After": "1"})
+        except FutureTimeout:
+            self._send_json(504, {"error": "Summarization timed out."})
+        except Exception as error:
+            self._send_json(500, {"error": f"{type(error).__name__}: {error}"})
+
+    def _route(self):
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/health":
+            return lambda payload: (200, {"status": "ok", "workers": self.service.workers})
+        if path == "/summarize":
+            return lambda payload: (
+                200, self.service.summarize([{"text": payload.get("text")}], parse_options(payload))[0]
+            )
+        if path == "/batch":
+            return self._batch
+        if path.startswith("/documents/") and path.endswith("/summary"):
+            name = unquote(path[len("/documents/"):-len("/summary")])
+            return lambda payload: (200, self.service.summarize([{"document": name}], parse_options(payload))[0])
+        return None
+
+    def _batch(self, payload):
+        items = payload.get("items")
+        if not isinstance(items, list) or not items:
+            raise BadRequest("'items' must be a non-empty list.")
+        return 200, {"results": self.service.summarize(items, parse_options(payload), item_errors=True)}
+
+    def do_GET(self):
+        route = self._route()
+        if route is None:
+            self._send_json(404, {"error": "Not found."})
+        else:
+            self._handle(route)
+
+    def do_POST(self):
+        self.do_GET()
+
+    def log_message(self, format, *args):
+        pass  # Log per permintaan dimatikan agar tidak membebani throughput
+
+
+# Fungsi untuk membuat server HTTP (dipakai juga oleh skrip uji beban)
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, folder=DOCUMENTS_FOLDER, workers=None,
+                  queue_size=DEFAULT_QUEUE_SIZE):
+    handler = type("BoundSummaryRequestHandler", (SummaryRequestHandler,), {
+        "service": SummaryService(folder, workers, queue_size),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve document summarization over HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--folder", default=DOCUMENTS_FOLDER, help="Folder of stored documents.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("-q", "--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="Requests allowed to wait for a worker before answering 429.")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.folder, args.workers, args.queue_size)
+    service = server.RequestHandlerClass.service
+    print(f"Serving summaries on http://{args.host}:{args.port} with {service.workers} worker(s).")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from instrumentation import stage
+from engines import DEFAULT_ENGINE, get_engine
+from segmenter import iter_sentence_spans, sentence_spans
+from stemmer import stemming_analyzer
+
+# Daftar stop words untuk Bahasa Indonesia
+STOP_WORDS_ID = [
+    "dan", "di", "ke", "dari", "untuk", "yang", "pada", "dengan", "dalam", "atau", "oleh", 
+    "sebagai", "adalah", "ini", "itu", "tidak", "bukan", "saya", "kami", "kita", "anda", 
+    "dia", "mereka", "ada", "jika", "karena", "tetapi", "namun", "bagaimana", "mengapa",
+    "apa", "dimana", "kapan", "siapa", "dapat", "harus", "akan", "sudah", "belum", "bisa"
+]
+
+# Pola token: kata dengan minimal 2 huruf
+TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+# Panjang ringkasan bawaan: bilangan bulat = jumlah kalimat, pecahan (0-1) = rasio dari jumlah kalimat
+DEFAULT_SUMMARY_LENGTH = 3
+
+# Bobot keberagaman MMR: 0 = murni skor, makin besar makin menghindari kalimat yang mirip
+DEFAULT_DIVERSITY = 0.0
+
+# Jumlah kandidat MMR per kalimat yang dipilih (kandidat diambil dari skor tertinggi),
+# dibatasi paling banyak sekian kandidat di luar k agar ringkasan rasio tidak memakai semua kalimat
+MMR_CANDIDATES_PER_SENTENCE = 5
+MMR_MAX_EXTRA_CANDIDATES = 1000
+
+# Mode vectorizer: "exact" membangun kosakata penuh, "hashing" memakai fitur hash berukuran tetap
+# sehingga memori kosakata konstan untuk dokumen yang sangat besar
+VECTORIZER_MODES = ("exact", "hashing")
+DEFAULT_VECTORIZER = "exact"
+
+# Jumlah kolom fitur hash dan jumlah kalimat yang divektorisasi per potongan
+HASHING_FEATURES = 2 ** 20
+HASHING_CHUNK_SENTENCES = 4096
+
+# Fungsi untuk mengubah panjang ringkasan (jumlah atau rasio) menjadi jumlah kalimat
+def resolve_summary_length(length, sentence_count):
+    if isinstance(length, float) and 0 < length < 1:
+        count = int(round(sentence_count * length))
+    else:
+        count = int(length)
+    return max(1, min(count, sentence_count)) if sentence_count else 0
+
+# Fungsi untuk memilih indeks k skor tertinggi tanpa mengurutkan semua kalimat (O(n))
+def top_k_indices(scores, k):
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+# Fungsi untuk menghitung jumlah kandidat MMR untuk k kalimat dari n kalimat
+def mmr_pool_size(k, n):
+    return min(n, k * MMR_CANDIDATES_PER_SENTENCE, k + MMR_MAX_EXTRA_CANDIDATES)
+
+# Fungsi untuk memilih kalimat dengan Maximal Marginal Relevance di atas matriks TF-IDF sparse
+# Kemiripan dihitung per pilihan (satu baris terhadap kandidat), jadi tidak ada matriks kandidat x kandidat
+def mmr_select(tf_idf_matrix, scores, k, diversity):
+    candidates = top_k_indices(scores, mmr_pool_size(k, len(scores)))
+    if len(candidates) <= k:
+        return candidates  # Semua kandidat terpilih, urutan pilihan tidak berpengaruh
+    candidate_matrix = sparse.csr_matrix(tf_idf_matrix[candidates])
+    # Matriks transpos (fitur x kandidat): kemiripan satu kalimat = baris fitur miliknya dikali bobotnya
+    feature_matrix = candidate_matrix.T.tocsr()
+    relevance = scores[candidates] / (scores[candidates].max() or 1.0)
+
+    selected = []
+    max_similarity = np.zeros(len(candidates))
+    available = np.ones(len(candidates), dtype=bool)
+    for _ in range(k):
+        marginal = (1 - diversity) * relevance - diversity * max_similarity
+        marginal[~available] = -np.inf
+        best = int(np.argmax(marginal))
+        selected.append(best)
+        available[best] = False
+        row = slice(candidate_matrix.indptr[best], candidate_matrix.indptr[best + 1])
+        similarity = feature_matrix[candidate_matrix.indices[row]].T @ candidate_matrix.data[row]
+        np.maximum(max_similarity, similarity, out=max_similarity)
+    return candidates[selected]
+
+# Fungsi untuk memilih kalimat ringkasan; hasil berupa indeks kalimat dalam urutan dokumen
+# Teks tanpa satu pun kata yang dihitung (hanya stop words atau kata satu huruf) menghasilkan ringkasan kosong
+def select_sentences(tf_idf_matrix, scores, length=DEFAULT_SUMMARY_LENGTH, diversity=DEFAULT_DIVERSITY):
+    scores = np.asarray(scores, dtype=np.float64)
+    k = resolve_summary_length(length, len(scores))
+    if k == 0 or tf_idf_matrix.nnz == 0:
+        return np.zeros(0, dtype=np.intp)
+    if diversity > 0:
+        chosen = mmr_select(tf_idf_matrix, scores, k, diversity)
+    else:
+        chosen = top_k_indices(scores, k)
+    return np.sort(chosen)
+
+# Fungsi untuk membuat analyzer (huruf kecil, pola token, stop words), opsional dengan stemming Bahasa Indonesia
+def build_analyzer(stemming=False):
+    analyzer = CountVectorizer(stop_words=STOP_WORDS_ID, token_pattern=TOKEN_PATTERN).build_analyzer()
+    return stemming_analyzer(analyzer) if stemming else analyzer
+
+# Fungsi untuk menghitung matriks TF-IDF dengan feature hashing (tanpa kamus kosakata)
+# Kalimat divektorisasi per potongan, lalu IDF dihitung dari matriks jumlah kata yang digabung
+def hashing_tf_idf_matrix(sentences, n_features=HASHING_FEATURES, chunk_sentences=HASHING_CHUNK_SENTENCES,
+                          stemming=False):
+    vectorizer = HashingVectorizer(
+        n_features=n_features,
+        analyzer=build_analyzer(stemming),
+        alternate_sign=False,  # Nilai tetap berupa jumlah kata agar IDF bisa dihitung
+        norm=None,
+        dtype=np.float32,
+    )
+    chunks = []
+    batch = []
+    for sentence in sentences:
+        batch.append(sentence)
+        if len(batch) == chunk_sentences:
+            chunks.append(vectorizer.transform(batch))
+            batch = []
+    if batch or not chunks:
+        chunks.append(vectorizer.transform(batch))
+    counts = sparse.vstack(chunks, format="csr") if len(chunks) > 1 else chunks[0]
+    return TfidfTransformer().fit_transform(counts)
+
+# Fungsi untuk menghitung matriks TF-IDF dengan IDF dari kalimat-kalimat itu sendiri (tanpa model korpus)
+# `stemming` menyatukan bentuk kata berimbuhan (membaca, dibaca -> baca) sebelum dihitung
+# Kosakata kosong menghasilkan matriks tanpa kolom (seperti mode hashing tanpa nilai), bukan ValueError
+def local_tf_idf_matrix(sentences, vectorizer=DEFAULT_VECTORIZER, stemming=False):
+    if vectorizer == "hashing":
+        return hashing_tf_idf_matrix(sentences, stemming=stemming)
+    if stemming:
+        tf_idf_vectorizer = TfidfVectorizer(analyzer=build_analyzer(stemming=True))
+    else:
+        tf_idf_vectorizer = TfidfVectorizer(
+            stop_words=STOP_WORDS_ID,  # Gunakan stop words Bahasa Indonesia
+            token_pattern=TOKEN_PATTERN  # Tokenize untuk kata dengan minimal 2 huruf
+        )
+    counted = [0]
+
+    def count_sentences():
+        for sentence in sentences:
+            counted[0] += 1
+            yield sentence
+
+    try:
+        return tf_idf_vectorizer.fit_transform(count_sentences())
+    except ValueError as error:
+        if "empty vocabulary" not in str(error):
+            raise
+        return sparse.csr_matrix((counted[0], 0), dtype=np.float64)
+
+# Fungsi untuk mengumpulkan potongan teks sambil meneruskannya ke segmenter
+def collect_chunks(chunks, pieces):
+    for chunk in chunks:
+        pieces.append(chunk)
+        yield chunk
+
+# Fungsi untuk menghitung TF-IDF Matrix dan memilih span kalimat dengan skor tertinggi
+# `document` bisa berupa string atau iterable potongan teks (misalnya iter_txt_chunks)
+# Jika `corpus_model` diberikan, IDF diambil dari model korpus (cukup transform, tanpa fit)
+# `engine` menentukan cara memberi skor kalimat (lihat engines.SUMMARIZER_ENGINES)
+# `length` adalah jumlah kalimat atau rasio, `diversity` adalah bobot MMR untuk membuang kalimat yang mirip
+# `vectorizer` memilih mode IDF lokal (lihat VECTORIZER_MODES); model korpus sudah memakai kosakata tetap
+# `stemming` memakai stemmer Bahasa Indonesia; kosakata model korpus tidak di-stem, jadi IDF lokal yang dipakai
+# Mengembalikan (teks, daftar span terpilih dalam urutan dokumen) dengan span berupa offset (start, end)
+def rank_sentence_spans(document, corpus_model=None, length=DEFAULT_SUMMARY_LENGTH, engine=DEFAULT_ENGINE,
+                        diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER, stemming=False):
+    score_sentences = get_engine(engine)
+    if vectorizer not in VECTORIZER_MODES:
+        raise ValueError(f"Unknown vectorizer '{vectorizer}'. Choose one of: {', '.join(VECTORIZER_MODES)}.")
+    with stage("segment"):
+        if isinstance(document, str):
+            text = document
+            spans = sentence_spans(text)  # Pisahkan dokumen menjadi kalimat
+        else:
+            pieces = []
+            spans = list(iter_sentence_spans(collect_chunks(document, pieces)))
+            text = "".join(pieces)
+    if not spans:
+        return text, []  # Dokumen kosong atau hanya berisi spasi
+
+    with stage("vectorize", sentences=len(spans)):
+        tf_idf_matrix = None
+        if corpus_model is not None and not stemming:
+            tf_idf_matrix = corpus_model.transform(text[start:end] for start, end in spans)
+            if tf_idf_matrix.nnz == 0:
+                tf_idf_matrix = None  # Teks tidak dikenal oleh korpus, pakai IDF lokal
+        if tf_idf_matrix is None:
+            tf_idf_matrix = local_tf_idf_matrix((text[start:end] for start, end in spans), vectorizer, stemming)
+
+    with stage("rank", engine=engine):
+        # Hitung skor untuk setiap kalimat, lalu pilih kalimat teratas sebagai ringkasan
+        sentence_scores = score_sentences(tf_idf_matrix)
+        chosen = select_sentences(tf_idf_matrix, sentence_scores, length, diversity)
+
+    return text, [spans[index] for index in chosen.tolist()]
+
+# Fungsi untuk menghitung ringkasan dokumen (secara bawaan 3 kalimat dengan skor tertinggi)
+def compute_tf_idf_summary(document, corpus_model=None, engine=DEFAULT_ENGINE, length=DEFAULT_SUMMARY_LENGTH,
+                           diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER, stemming=False):
+    text, summary_spans = rank_sentence_spans(
+        document, corpus_model, length, engine, diversity, vectorizer, stemming
+    )
+    summary = ' '.join(text[start:end] for start, end in summary_spans)
+    return summary
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import threading
+
+from engines import DEFAULT_ENGINE
+from summarizer import (
+    DEFAULT_DIVERSITY,
+    DEFAULT_SUMMARY_LENGTH,
+    DEFAULT_VECTORIZER,
+    STOP_WORDS_ID,
+    TOKEN_PATTERN,
+    rank_sentence_spans,
+)
+from text_cache import MemoryLRU, evict_folder, write_atomic
+
+# Folder cache ringkasan di disk (None untuk mematikan tingkat disk)
+CACHE_FOLDER = os.path.join(".cache", "summaries")
+
+MEMORY_LIMIT_BYTES = 16 * 1024 * 1024
+DISK_LIMIT_BYTES = 128 * 1024 * 1024
+
+# Pengaturan vectorizer ikut menjadi bagian kunci, agar perubahan stop words tidak memakai hasil lama
+VECTORIZER_SETTINGS = json.dumps({"stop_words": sorted(STOP_WORDS_ID), "token_pattern": TOKEN_PATTERN})
+
+
+# Fungsi untuk membuat kunci cache dari hash teks, engine, dan parameter ringkasan
+def summary_key(text, engine, length, corpus_revision=None, **params):
+    digest = hashlib.sha256()
+    digest.update(text.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(
+        {"engine": engine, "length": length, "corpus": corpus_revision, "params": params},
+        sort_keys=True,
+    ).encode("utf-8"))
+    digest.update(VECTORIZER_SETTINGS.encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Cache hasil ringkasan (daftar span kalimat) dengan LRU di memori dan tingkat disk opsional
+class SummaryCache:
+    def __init__(self, folder=CACHE_FOLDER, memory_limit=MEMORY_LIMIT_BYTES, disk_limit=DISK_LIMIT_BYTES):
+        self.folder = folder
+        self.disk_limit = disk_limit
+        # Yang disimpan hanya span (bukan teks), jadi ukurannya kecil
+        self._memory = MemoryLRU(memory_limit, lambda spans: 64 + 16 * len(spans))
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def get(self, key):
+        spans = self._memory.get(key)
+        if spans is not None:
+            self._count("memory_hits")
+            return spans
+        if self.folder:
+            path = os.path.join(self.folder, key + ".json")
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    spans = [tuple(span) for span in json.load(file)]
+            except (OSError, ValueError):
+                spans = None
+            if spans is not None:
+                self._count("disk_hits")
+                self._memory.put(key, spans)
+                return spans
+        self._count("misses")
+        return None
+
+    def put(self, key, spans):
+        spans = [tuple(span) for span in spans]
+        self._memory.put(key, spans)
+        if self.folder:
+            os.makedirs(self.folder, exist_ok=True)
+            write_atomic(os.path.join(self.folder, key + ".json"), json.dumps(spans).encode("utf-8"))
+            evict_folder(self.folder, self.disk_limit, ".json")
+
+
+# Cache bersama untuk semua sesi server (modul hanya di-import sekali)
+summary_cache = SummaryCache()
+
+
+# Fungsi untuk meringkas teks melalui cache; mengembalikan (teks, span terpilih) seperti rank_sentence_spans
+def cached_rank_sentence_spans(text, corpus_model=None, length=DEFAULT_SUMMARY_LENGTH, engine=DEFAULT_ENGINE,
+                               diversity=DEFAULT_DIVERSITY, vectorizer=DEFAULT_VECTORIZER, stemming=False):
+    # Dengan stemming model korpus tidak dipakai (lihat rank_sentence_spans)
+    revision = corpus_model.revision if corpus_model is not None and not stemming else None
+    params = {"diversity": diversity}
+    if vectorizer != DEFAULT_VECTORIZER:
+        params["vectorizer"] = vectorizer  # Kunci mode bawaan tidak berubah, cache lama tetap terpakai
+    if stemming:
+        params["stemming"] = True
+    key = summary_key(text, engine, length, revision, **params)
+    spans = summary_cache.get(key)
+    if spans is None:
+        text, spans = rank_sentence_spans(text, corpus_model, length, engine, diversity, vectorizer, stemming)
+        summary_cache.put(key, spans)
+    return text, spans
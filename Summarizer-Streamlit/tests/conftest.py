@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modul aplikasi (summarizer, benchmarks, ...) di-import dari folder Summarizer-Streamlit,
+# sehingga tes bisa dijalankan dari folder mana pun, dengan `pytest` maupun `python -m pytest`
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from benchmarks.synthetic import make_text
+from summarizer import rank_sentence_spans
+
+# Dokumen contoh di folder 'documents'
+SAMPLE_DOCUMENT = os.path.join(os.path.dirname(__file__), os.pardir, "documents", "teks1.txt")
+
+# Bagian minimal kalimat terpilih yang harus sama antara mode hashing dan exact (tabrakan hash boleh sedikit menggeser)
+MIN_OVERLAP = 0.9
+
+
+@pytest.fixture(scope="module", params=["teks1", "synthetic"])
+def document(request):
+    if request.param == "teks1":
+        with open(SAMPLE_DOCUMENT, encoding="utf-8") as file:
+            return file.read()
+    return make_text(200_000)
+
+
+# Fungsi untuk menghitung bagian kalimat terpilih yang sama di kedua mode
+def selection_overlap(text, length, diversity, stemming):
+    _, exact = rank_sentence_spans(text, None, length, "tfidf", diversity, "exact", stemming)
+    _, hashing = rank_sentence_spans(text, None, length, "tfidf", diversity, "hashing", stemming)
+    assert len(exact) == len(hashing)
+    return len(set(exact) & set(hashing)) / max(len(exact), 1)
+
+
+@pytest.mark.parametrize("length", [3, 10, 0.1, 0.3])
+@pytest.mark.parametrize("diversity", [0.0, 0.3])
+def test_hashing_matches_exact_selection(document, length, diversity):
+    assert selection_overlap(document, length, diversity, stemming=False) >= MIN_OVERLAP
+
+
+@pytest.mark.parametrize("length", [3, 0.2])
+def test_hashing_matches_exact_selection_with_stemming(document, length):
+    assert selection_overlap(document, length, 0.0, stemming=True) >= MIN_OVERLAP
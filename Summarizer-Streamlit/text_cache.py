@@ -0,0 +1,201 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+# Folder untuk menyimpan cache teks hasil ekstraksi (bertahan setelah restart)
+CACHE_FOLDER = os.path.join(".cache", "text")
+
+# Batas ukuran cache (dalam byte) untuk memori dan disk
+MEMORY_LIMIT_BYTES = 64 * 1024 * 1024
+DISK_LIMIT_BYTES = 512 * 1024 * 1024
+
+# Ukuran blok saat menghitung hash isi file
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Jumlah path file yang hash isinya diingat; path yang paling lama tidak dipakai dibuang lebih dulu
+MAX_FINGERPRINTS = 10000
+
+
+# Fungsi untuk menghitung hash isi file secara bertahap
+def hash_file(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# LRU di memori yang dibatasi total ukuran (byte) nilai yang disimpan
+class MemoryLRU:
+    def __init__(self, limit_bytes, sizeof):
+        self.limit_bytes = limit_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if size > self.limit_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            # Buang entri yang paling lama tidak dipakai sampai di bawah batas
+            while self._bytes > self.limit_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# Fungsi untuk menghapus file cache tertua di folder sampai total ukurannya di bawah batas
+def evict_folder(folder, limit_bytes, suffix):
+    entries = []
+    total = 0
+    with os.scandir(folder) as scanner:
+        for entry in scanner:
+            if not entry.name.endswith(suffix):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total += stat.st_size
+    if total <= limit_bytes:
+        return
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= limit_bytes:
+            break
+
+
+# Fungsi untuk menulis file secara atomik (tulis ke file sementara lalu ganti)
+def write_atomic(path, data):
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+# Cache teks dua tingkat: LRU di memori dan file di disk
+class TextCache:
+    def __init__(self, folder=CACHE_FOLDER, memory_limit=MEMORY_LIMIT_BYTES, disk_limit=DISK_LIMIT_BYTES):
+        self.folder = folder
+        self.memory_limit = memory_limit
+        self.disk_limit = disk_limit
+        self._memory = MemoryLRU(memory_limit, lambda text: len(text.encode("utf-8")))
+        # path -> (size, mtime, hash isi), agar file yang tidak berubah tidak perlu di-hash ulang
+        # Satu entri per path (diganti saat file berubah) dan paling banyak MAX_FINGERPRINTS path
+        self._fingerprints = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    # Kunci cache: hash isi file ditambah nama fungsi pembaca (dan `key_suffix`, misalnya rentang halaman)
+    def key_for(self, filepath, reader, key_suffix=""):
+        stat = os.stat(filepath)
+        path = os.path.abspath(filepath)
+        with self._lock:
+            entry = self._fingerprints.get(path)
+            if entry is not None:
+                self._fingerprints.move_to_end(path)
+        if entry is not None and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+            content_hash = entry[2]
+        else:
+            content_hash = hash_file(filepath)
+            with self._lock:
+                self._fingerprints[path] = (stat.st_size, stat.st_mtime_ns, content_hash)
+                self._fingerprints.move_to_end(path)
+                while len(self._fingerprints) > MAX_FINGERPRINTS:
+                    self._fingerprints.popitem(last=False)
+        return f"{content_hash}-{reader.__name__}{key_suffix}"
+
+    # Ambil teks dari cache, atau baca file dengan `reader` jika belum ada
+    # Argumen tambahan (misalnya callback progres) hanya diteruskan ke `reader` dan bukan bagian dari kunci;
+    # argumen yang mengubah hasil harus ikut diwakili `key_suffix`
+    def read(self, filepath, reader, *args, key_suffix="", **kwargs):
+        key = self.key_for(filepath, reader, key_suffix)
+
+        text = self._memory.get(key)
+        if text is not None:
+            self._count("memory_hits")
+            return text
+
+        text = self._disk_get(key)
+        if text is not None:
+            self._count("disk_hits")
+            self._memory.put(key, text)
+            return text
+
+        self._count("misses")
+        text = reader(filepath, *args, **kwargs)
+        self._memory.put(key, text)
+        self._disk_put(key, text)
+        return text
+
+    def clear(self):
+        self._memory.clear()
+        with self._lock:
+            self._fingerprints.clear()
+            for name in self.stats:
+                self.stats[name] = 0
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _disk_path(self, key):
+        return os.path.join(self.folder, key + ".txt")
+
+    def _disk_get(self, key):
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                text = file.read()
+        except OSError:
+            return None
+        # Perbarui waktu akses agar eviksi di disk juga berurutan LRU
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return text
+
+    def _disk_put(self, key, text):
+        data = text.encode("utf-8")
+        if len(data) > self.disk_limit:
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        write_atomic(self._disk_path(key), data)
+        evict_folder(self.folder, self.disk_limit, ".txt")
+
+
+# Cache bersama untuk seluruh proses (modul hanya di-import sekali oleh Streamlit)
+text_cache = TextCache()
+
+
+# Fungsi untuk membaca file melalui cache teks
+def cached_read(filepath, reader, *args, key_suffix="", **kwargs):
+    return text_cache.read(filepath, reader, *args, key_suffix=key_suffix, **kwargs)
+
+
+# Fungsi untuk melihat jumlah hit/miss cache
+def cache_stats():
+    with text_cache._lock:
+        return dict(text_cache.stats)
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+import threading
+
+from text_cache import hash_file
+
+# Indeks hash isi -> nama file di folder dokumen
+INDEX_PATH = os.path.join(".cache", "uploads.json")
+
+_lock = threading.Lock()
+
+
+# Fungsi untuk menghitung hash isi file unggahan
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _load_index(index_path):
+    try:
+        with open(index_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(index, index_path):
+    os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(index, file, indent=1)
+    os.replace(temp_path, index_path)
+
+
+# Fungsi untuk memilih nama file untuk isi dengan hash `digest`
+# Mengembalikan (nama, True jika file dengan nama itu sudah berisi byte yang sama)
+# File lama yang belum tercatat di indeks (misalnya ditaruh langsung di folder) di-hash jika ukurannya sama
+def _free_name(folder, filename, digest, size):
+    stem, extension = os.path.splitext(filename)
+    for candidate in (filename, f"{stem}-{digest[:8]}{extension}"):
+        path = os.path.join(folder, candidate)
+        if not os.path.exists(path):
+            return candidate, False
+        if os.path.getsize(path) == size and hash_file(path) == digest:
+            return candidate, True
+    return candidate, False  # Nama dengan hash sendiri berisi data lain (sangat jarang): ditimpa
+
+
+# Fungsi untuk menyimpan byte asli unggahan satu kali berdasarkan hash isinya
+# Mengembalikan (path file, True jika baru disimpan / False jika isi yang sama sudah ada)
+def store_upload(folder, filename, data, index_path=INDEX_PATH):
+    digest = hash_bytes(data)
+    filename = os.path.basename(filename)
+    with _lock:
+        index = _load_index(index_path)
+        # Buang entri yang menunjuk ke file yang sudah dihapus
+        index = {key: name for key, name in index.items() if os.path.exists(os.path.join(folder, name))}
+        existing = index.get(digest)
+        # Cek ukuran agar file yang sudah diubah tidak dianggap masih tersimpan
+        if existing is not None and os.path.getsize(os.path.join(folder, existing)) == len(data):
+            return os.path.join(folder, existing), False
+
+        os.makedirs(folder, exist_ok=True)
+        filename, stored = _free_name(folder, filename, digest, len(data))
+        filepath = os.path.join(folder, filename)
+        if not stored:
+            temp_path = f"{filepath}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, filepath)
+
+        index[digest] = filename
+        _save_index(index, index_path)
+        return filepath, not stored